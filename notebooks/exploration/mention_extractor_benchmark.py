@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Set
 
 from src.analytics.mention_extractor import MentionExtractor
 
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 
 @dataclass
 class BenchmarkResult:
@@ -49,13 +57,76 @@ def _score(predicted: Iterable[str], expected: Iterable[str]) -> tuple[int, int,
     return tp, fp, fn
 
 
-def _evaluate(strategy: str, extractor: MentionExtractor) -> BenchmarkResult:
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _build_alias_scanner(
+    aliases: Mapping[str, Sequence[str]], backend: str | None = None
+) -> Callable[[str], Set[str]]:
+    """Return a matcher that finds every alias in a single pass over case-folded text.
+
+    ``backend`` is ``"aho"`` (pyahocorasick, the default when installed) or ``"regex"``
+    (one compiled alternation); ``MENTION_BENCHMARK_BACKEND`` overrides the default.
+    """
+
+    lookup = {
+        alias.casefold(): canonical for canonical, names in aliases.items() for alias in names
+    }
+    backend = backend or os.getenv("MENTION_BENCHMARK_BACKEND") or (
+        "aho" if ahocorasick is not None else "regex"
+    )
+    if backend == "aho":
+        if ahocorasick is None:
+            raise ImportError("The 'aho' benchmark backend requires pyahocorasick")
+        automaton = ahocorasick.Automaton()
+        for alias, canonical in lookup.items():
+            automaton.add_word(alias, (len(alias), canonical))
+        automaton.make_automaton()
+
+        def scan(text: str) -> Set[str]:
+            found: Set[str] = set()
+            for end, (length, canonical) in automaton.iter(text):
+                start = end - length + 1
+                # Same leading word boundary as the regex backend's ``\b``.
+                if start and _is_word_char(text[start - 1]) == _is_word_char(text[start]):
+                    continue
+                found.add(canonical)
+            return found
+
+        return scan
+    if backend != "regex":
+        raise ValueError(f"Unsupported benchmark backend '{backend}'. Use 'aho' or 'regex'.")
+
+    alternation = "|".join(re.escape(alias) for alias in sorted(lookup, key=len, reverse=True))
+    pattern = re.compile(rf"\b(?:{alternation})")
+    return lambda text: {lookup[match.group(0)] for match in pattern.finditer(text)}
+
+
+@lru_cache(maxsize=None)
+def _alias_scanner() -> Callable[[str], Set[str]]:
+    """Build the benchmark scanner on first use so importing never needs the backend."""
+
+    return _build_alias_scanner(PRODUCT_ALIASES)
+
+
+CASEFOLDED_CORPUS = [(text.casefold(), expected) for text, expected in CORPUS]
+
+
+def _extractor_predictions(extractor: MentionExtractor) -> Callable[[str], Set[str]]:
+    return lambda text: {m.product_canonical for m in extractor.extract(text)}
+
+
+def _evaluate(
+    strategy: str,
+    predict: Callable[[str], Set[str]],
+    corpus: Sequence[tuple[str, Set[str]]] = CORPUS,
+) -> BenchmarkResult:
     tp_total = fp_total = fn_total = 0
     predicted_total = expected_total = 0
 
-    for text, expected in CORPUS:
-        mentions = extractor.extract(text)
-        predicted = {m.product_canonical for m in mentions}
+    for text, expected in corpus:
+        predicted = predict(text)
         tp, fp, fn = _score(predicted, expected)
         tp_total += tp
         fp_total += fp
@@ -85,8 +156,9 @@ def run() -> List[BenchmarkResult]:
     model_extractor = MentionExtractor(PRODUCT_ALIASES, use_model_assisted=True)
 
     results = [
-        _evaluate("regex", regex_extractor),
-        _evaluate("model_assisted", model_extractor),
+        _evaluate("regex", _extractor_predictions(regex_extractor)),
+        _evaluate("model_assisted", _extractor_predictions(model_extractor)),
+        _evaluate("alias_scan", _alias_scanner(), CASEFOLDED_CORPUS),
     ]
     return results
 
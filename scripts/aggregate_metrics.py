@@ -4,24 +4,30 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from src.analytics.narrative_kpis import load_narrative_kpis
 from src.analytics.time_series import (
-    TimeSeriesConfig,
     add_change_metrics,
-    bucket_counts,
+    bucketed_rows,
     compute_change_status,
+    sql_bucket_start,
 )
+from src.storage import connect_readonly
+from src.utils.parquet import write_rows
 
 ALL_PRODUCTS_LABEL = "(all)"
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 DEFAULT_OUTDIR = Path("data/processed/metrics")
 DEFAULT_KPI_CONFIG = Path("config/narratives_kpis.json")
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+FETCH_ARRAYSIZE = 8192
 
 
 @dataclass
@@ -76,91 +82,157 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_KPI_CONFIG,
         help="Path to the narrative KPI configuration (default: config/narratives_kpis.json).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Processes used to run the aggregations in parallel (1 runs them inline).",
+    )
     return parser.parse_args()
 
 
-def _load_rows(con: sqlite3.Connection, query: str) -> List[dict]:
+def _connect(db_path: Path) -> sqlite3.Connection:
+    con = connect_readonly(db_path)
     con.row_factory = sqlite3.Row
-    cur = con.execute(query)
-    return [dict(row) for row in cur.fetchall()]
+    return con
 
 
-def _aggregate_documents(con: sqlite3.Connection, freq: str) -> List[dict]:
-    total_rows = _load_rows(
-        con,
-        "SELECT publication_date FROM documents WHERE publication_date IS NOT NULL",
+def _bucket_alias(freq: str) -> str:
+    return f"bucket_{freq.lower()}"
+
+
+def _bucket_select(column: str, freqs: Sequence[str]) -> str:
+    """SELECT-list fragment exposing one ``bucket_<freq>`` column per frequency."""
+
+    return ", ".join(
+        f"{sql_bucket_start(column, freq)} AS {_bucket_alias(freq)}" for freq in freqs
     )
-    total_config = TimeSeriesConfig(timestamp_column="publication_date", freq=freq)
-    total_agg = add_change_metrics(bucket_counts(total_config, total_rows))
-    for row in total_agg:
-        row["product_canonical"] = ALL_PRODUCTS_LABEL
 
-    product_rows = _load_rows(
+
+def _bucket_group(freqs: Sequence[str]) -> str:
+    return ", ".join(_bucket_alias(freq) for freq in freqs)
+
+
+def _load_bucketed(
+    con: sqlite3.Connection,
+    query: str,
+    freqs: Sequence[str],
+    group_columns: Sequence[str] = (),
+    value_columns: Sequence[str] = ("count",),
+) -> Dict[str, List[dict]]:
+    """Split rows grouped by every ``bucket_<freq>`` column into one series per freq.
+
+    A single scan serves all frequencies: a week straddling two months arrives
+    as two rows, so ``query`` is materialized once and each frequency is rolled
+    up from it with a second ``GROUP BY`` inside SQLite.
+    """
+
+    sums = ", ".join(f"SUM({col}) AS {col}" for col in value_columns)
+    rollups = []
+    for freq in freqs:
+        alias = _bucket_alias(freq)
+        selected = ", ".join([f"'{freq}' AS freq", *group_columns, f"{alias} AS bucket_start"])
+        keys = ", ".join([*group_columns, alias])
+        rollups.append(f"SELECT {selected}, {sums} FROM scan GROUP BY {keys}")
+    order = ", ".join(["freq", *group_columns, "bucket_start"])
+    cur = con.cursor()
+    cur.row_factory = None  # plain tuples; the columns are zipped in once below
+    cur.arraysize = FETCH_ARRAYSIZE
+    cur.execute(f"WITH scan AS ({query}) {' UNION ALL '.join(rollups)} ORDER BY {order}")
+    columns = [col[0] for col in cur.description][1:]
+
+    rows: Dict[str, List[dict]] = {freq: [] for freq in freqs}
+    for batch in iter(cur.fetchmany, []):
+        for freq, *values in batch:
+            rows[freq].append(dict(zip(columns, values)))
+    return {freq: bucketed_rows(rows[freq], value_columns) for freq in freqs}
+
+
+def _aggregate_documents(con: sqlite3.Connection, freqs: Sequence[str]) -> Dict[str, List[dict]]:
+    totals = _load_bucketed(
         con,
-        """
-        SELECT DISTINCT pm.doc_id, pm.product_canonical, d.publication_date
+        f"""
+        SELECT {_bucket_select("publication_date", freqs)}, COUNT(*) AS count
+        FROM documents
+        WHERE publication_date IS NOT NULL
+        GROUP BY {_bucket_group(freqs)}
+        """,
+        freqs,
+    )
+    products = _load_bucketed(
+        con,
+        f"""
+        SELECT pm.product_canonical,
+               {_bucket_select("d.publication_date", freqs)},
+               COUNT(DISTINCT pm.doc_id) AS count
         FROM product_mentions pm
         JOIN documents d ON pm.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
           AND pm.product_canonical IS NOT NULL
-        """
-    )
-    product_config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["product_canonical"],
-    )
-    product_agg = add_change_metrics(
-        bucket_counts(product_config, product_rows),
-        group_columns=["product_canonical"],
+        GROUP BY pm.product_canonical, {_bucket_group(freqs)}
+        """,
+        freqs,
+        ["product_canonical"],
     )
-    return total_agg + product_agg
+
+    frames: Dict[str, List[dict]] = {}
+    for freq in freqs:
+        total_agg = add_change_metrics(totals[freq])
+        for row in total_agg:
+            row["product_canonical"] = ALL_PRODUCTS_LABEL
+        product_agg = add_change_metrics(
+            products[freq], group_columns=["product_canonical"]
+        )
+        frames[freq] = total_agg + product_agg
+    return frames
 
 
-def _aggregate_mentions(con: sqlite3.Connection, freq: str) -> List[dict]:
-    rows = _load_rows(
+def _aggregate_mentions(con: sqlite3.Connection, freqs: Sequence[str]) -> Dict[str, List[dict]]:
+    group_columns = ["product_canonical"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date, pm.product_canonical
+        f"""
+        SELECT pm.product_canonical,
+               {_bucket_select("d.publication_date", freqs)},
+               COUNT(*) AS count
         FROM product_mentions pm
         JOIN documents d ON pm.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
+        GROUP BY pm.product_canonical, {_bucket_group(freqs)}
         """,
+        freqs,
+        group_columns,
     )
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["product_canonical"],
-    )
-    agg = bucket_counts(config, rows)
-    return add_change_metrics(agg, group_columns=["product_canonical"])
+    return {
+        freq: add_change_metrics(agg, group_columns=group_columns)
+        for freq, agg in aggs.items()
+    }
 
 
-def _aggregate_co_mentions(con: sqlite3.Connection, freq: str) -> List[dict]:
-    rows = _load_rows(
+def _aggregate_co_mentions(con: sqlite3.Connection, freqs: Sequence[str]) -> Dict[str, List[dict]]:
+    group_columns = ["product_a", "product_b"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date, cm.product_a, cm.product_b, cm.count
+        f"""
+        SELECT cm.product_a,
+               cm.product_b,
+               {_bucket_select("d.publication_date", freqs)},
+               SUM(cm.count) AS count
         FROM co_mentions cm
         JOIN documents d ON cm.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
+        GROUP BY cm.product_a, cm.product_b, {_bucket_group(freqs)}
         """,
+        freqs,
+        group_columns,
     )
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["product_a", "product_b"],
-        value_column="count",
-        sum_value=True,
-    )
-    agg = bucket_counts(config, rows)
-    return add_change_metrics(agg, group_columns=["product_a", "product_b"])
+    return {
+        freq: add_change_metrics(agg, group_columns=group_columns)
+        for freq, agg in aggs.items()
+    }
 
 
 def _validation_metrics(con: sqlite3.Connection) -> dict:
-    con.row_factory = sqlite3.Row
     row = con.execute(
         """
         SELECT
@@ -186,281 +258,245 @@ def _validation_metrics(con: sqlite3.Connection) -> dict:
     }
 
 
-def _aggregate_weighted_co_mentions(con: sqlite3.Connection, freq: str) -> List[dict]:
-    rows = _load_rows(
+def _aggregate_weighted_co_mentions(
+    con: sqlite3.Connection, freqs: Sequence[str]
+) -> Dict[str, List[dict]]:
+    group_columns = ["product_a", "product_b"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date, cm.product_a, cm.product_b, cm.weighted_count
+        f"""
+        SELECT cm.product_a,
+               cm.product_b,
+               {_bucket_select("d.publication_date", freqs)},
+               SUM(cm.weighted_count) AS count
         FROM co_mentions_weighted cm
         JOIN documents d ON cm.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
+        GROUP BY cm.product_a, cm.product_b, {_bucket_group(freqs)}
         """,
+        freqs,
+        group_columns,
     )
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["product_a", "product_b"],
-        value_column="weighted_count",
-        sum_value=True,
-    )
-    agg = bucket_counts(config, rows)
-    return add_change_metrics(
-        agg, group_columns=["product_a", "product_b"], value_column="count"
-    )
+    return {
+        freq: add_change_metrics(agg, group_columns=group_columns, value_column="count")
+        for freq, agg in aggs.items()
+    }
 
 
-def _aggregate_directional_events(con: sqlite3.Connection, freq: str) -> List[dict]:
-    rows = _load_rows(
+def _aggregate_directional_events(
+    con: sqlite3.Connection, freqs: Sequence[str]
+) -> Dict[str, List[dict]]:
+    group_columns = ["product", "partner", "direction_type", "role"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT
-            d.publication_date,
-            se.product_a,
-            se.product_b,
-            se.direction_type,
-            se.product_a_role,
-            se.product_b_role
-        FROM sentence_events se
-        JOIN documents d ON se.doc_id = d.doc_id
-        WHERE d.publication_date IS NOT NULL
-          AND se.direction_type IS NOT NULL
+        f"""
+        WITH expanded AS (
+            SELECT d.publication_date,
+                   se.product_a AS product,
+                   se.product_b AS partner,
+                   se.direction_type,
+                   se.product_a_role AS role
+            FROM sentence_events se
+            JOIN documents d ON se.doc_id = d.doc_id
+            WHERE d.publication_date IS NOT NULL
+              AND se.direction_type IS NOT NULL
+              AND COALESCE(se.product_a_role, '') != ''
+            UNION ALL
+            SELECT d.publication_date,
+                   se.product_b AS product,
+                   se.product_a AS partner,
+                   se.direction_type,
+                   se.product_b_role AS role
+            FROM sentence_events se
+            JOIN documents d ON se.doc_id = d.doc_id
+            WHERE d.publication_date IS NOT NULL
+              AND se.direction_type IS NOT NULL
+              AND COALESCE(se.product_b_role, '') != ''
+        )
+        SELECT product, partner, direction_type, role,
+               {_bucket_select("publication_date", freqs)},
+               COUNT(*) AS count
+        FROM expanded
+        GROUP BY product, partner, direction_type, role, {_bucket_group(freqs)}
         """,
+        freqs,
+        group_columns,
     )
-
-    expanded: List[dict] = []
-    for row in rows:
-        for product_key, role_key, partner_key in (
-            ("product_a", "product_a_role", "product_b"),
-            ("product_b", "product_b_role", "product_a"),
-        ):
-            role_value = row.get(role_key)
-            if not role_value:
-                continue
-            expanded.append(
-                {
-                    "publication_date": row["publication_date"],
-                    "product": row[product_key],
-                    "partner": row[partner_key],
-                    "direction_type": row["direction_type"],
-                    "role": role_value,
-                }
-            )
-
-    if not expanded:
-        return []
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["product", "partner", "direction_type", "role"],
-    )
-    agg = bucket_counts(config, expanded)
-    return add_change_metrics(
-        agg, group_columns=["product", "partner", "direction_type", "role"]
-    )
+    return {
+        freq: add_change_metrics(agg, group_columns=group_columns) if agg else []
+        for freq, agg in aggs.items()
+    }
 
 
 def _aggregate_narratives(
-    con: sqlite3.Connection, freq: str, change_config: NarrativeChangeConfig
-) -> Tuple[List[dict], List[dict]]:
-    rows = _load_rows(
+    con: sqlite3.Connection, freqs: Sequence[str], change_config: NarrativeChangeConfig
+) -> Tuple[Dict[str, List[dict]], Dict[str, List[dict]]]:
+    group_columns = ["narrative_type", "narrative_subtype"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date,
-               se.narrative_type,
+        f"""
+        SELECT se.narrative_type,
                se.narrative_subtype,
-               se.narrative_confidence
+               {_bucket_select("d.publication_date", freqs)},
+               COUNT(*) AS count
         FROM sentence_events se
         JOIN documents d ON se.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
           AND se.narrative_type IS NOT NULL
+        GROUP BY se.narrative_type, se.narrative_subtype, {_bucket_group(freqs)}
         """,
-    )
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["narrative_type", "narrative_subtype"],
-    )
-    agg = bucket_counts(config, rows)
-    change_rows = compute_change_status(
-        agg,
-        group_columns=["narrative_type", "narrative_subtype"],
-        lookback=change_config.lookback,
-        min_ratio=change_config.min_ratio,
-        min_count=change_config.min_count,
-    )
-    enriched = add_change_metrics(
-        agg, group_columns=["narrative_type", "narrative_subtype"]
-    )
-    return enriched, change_rows
+        freqs,
+        group_columns,
+    )
+    enriched: Dict[str, List[dict]] = {}
+    changes: Dict[str, List[dict]] = {}
+    for freq, agg in aggs.items():
+        changes[freq] = compute_change_status(
+            agg,
+            group_columns=group_columns,
+            lookback=change_config.lookback,
+            min_ratio=change_config.min_ratio,
+            min_count=change_config.min_count,
+        )
+        enriched[freq] = add_change_metrics(agg, group_columns=group_columns)
+    return enriched, changes
 
 
-def _aggregate_weighted_narratives(con: sqlite3.Connection, freq: str) -> List[dict]:
-    rows = _load_rows(
+def _aggregate_weighted_narratives(
+    con: sqlite3.Connection, freqs: Sequence[str]
+) -> Dict[str, List[dict]]:
+    group_columns = ["narrative_type", "narrative_subtype"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date,
-               se.narrative_type,
+        f"""
+        SELECT se.narrative_type,
                se.narrative_subtype,
-               COALESCE(dw.combined_weight, dw.study_type_weight, 1.0) AS weight
+               {_bucket_select("d.publication_date", freqs)},
+               SUM(COALESCE(dw.combined_weight, dw.study_type_weight, 1.0)) AS weighted_count
         FROM sentence_events se
         JOIN documents d ON se.doc_id = d.doc_id
         LEFT JOIN document_weights dw ON se.doc_id = dw.doc_id
         WHERE d.publication_date IS NOT NULL
           AND se.narrative_type IS NOT NULL
+        GROUP BY se.narrative_type, se.narrative_subtype, {_bucket_group(freqs)}
         """,
+        freqs,
+        group_columns,
+        ["weighted_count"],
     )
-    for row in rows:
-        row["weight"] = row.get("weight") or 1.0
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["narrative_type", "narrative_subtype"],
-        value_column="weight",
-        sum_value=True,
-    )
-    agg = bucket_counts(config, rows)
-    for row in agg:
-        row["weighted_count"] = row.pop("count")
-    return add_change_metrics(
-        agg,
-        group_columns=["narrative_type", "narrative_subtype"],
-        value_column="weighted_count",
-    )
+    return {
+        freq: add_change_metrics(agg, group_columns=group_columns, value_column="weighted_count")
+        for freq, agg in aggs.items()
+    }
 
 
-def _aggregate_narrative_dimensions(con: sqlite3.Connection, freq: str) -> List[dict]:
-    rows = _load_rows(
+def _aggregate_narrative_dimensions(
+    con: sqlite3.Connection, freqs: Sequence[str]
+) -> Dict[str, List[dict]]:
+    group_columns = ["narrative_type", "narrative_subtype", "claim_strength", "risk_posture"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date,
-               se.narrative_type,
+        f"""
+        SELECT se.narrative_type,
                se.narrative_subtype,
-               se.claim_strength,
-               se.risk_posture
+               COALESCE(NULLIF(se.claim_strength, ''), 'unlabeled') AS claim_strength,
+               COALESCE(NULLIF(se.risk_posture, ''), 'unlabeled') AS risk_posture,
+               {_bucket_select("d.publication_date", freqs)},
+               COUNT(*) AS count
         FROM sentence_events se
         JOIN documents d ON se.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
           AND se.narrative_type IS NOT NULL
+        GROUP BY se.narrative_type, se.narrative_subtype, claim_strength, risk_posture,
+                 {_bucket_group(freqs)}
         """,
+        freqs,
+        group_columns,
     )
-
-    for row in rows:
-        row["claim_strength"] = row.get("claim_strength") or "unlabeled"
-        row["risk_posture"] = row.get("risk_posture") or "unlabeled"
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["narrative_type", "narrative_subtype", "claim_strength", "risk_posture"],
-    )
-    agg = bucket_counts(config, rows)
-    return add_change_metrics(
-        agg,
-        group_columns=["narrative_type", "narrative_subtype", "claim_strength", "risk_posture"],
-    )
+    return {
+        freq: add_change_metrics(agg, group_columns=group_columns)
+        for freq, agg in aggs.items()
+    }
 
 
-def _aggregate_risk_signals(con: sqlite3.Connection, freq: str) -> List[dict]:
-    base_rows = _load_rows(
+def _aggregate_risk_signals(con: sqlite3.Connection, freqs: Sequence[str]) -> Dict[str, List[dict]]:
+    count_columns = ["total_count", "safety_count", "concern_count", "reassurance_count"]
+    aggs = _load_bucketed(
         con,
-        """
-        SELECT d.publication_date,
-               se.product_a,
+        f"""
+        SELECT se.product_a,
                se.product_b,
-               se.narrative_type,
-               se.risk_posture
+               {_bucket_select("d.publication_date", freqs)},
+               COUNT(*) AS total_count,
+               SUM(CASE WHEN se.narrative_type = 'safety' THEN 1 ELSE 0 END) AS safety_count,
+               SUM(CASE WHEN se.narrative_type = 'concern' THEN 1 ELSE 0 END) AS concern_count,
+               SUM(
+                   CASE
+                       WHEN se.narrative_type = 'safety' AND se.risk_posture = 'reassurance'
+                       THEN 1 ELSE 0
+                   END
+               ) AS reassurance_count
         FROM sentence_events se
         JOIN documents d ON se.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
           AND se.product_a IS NOT NULL
           AND se.product_b IS NOT NULL
+        GROUP BY se.product_a, se.product_b, {_bucket_group(freqs)}
         """,
-    )
-    if not base_rows:
-        return []
-
-    config = TimeSeriesConfig(
-        timestamp_column="publication_date",
-        freq=freq,
-        group_columns=["product_a", "product_b"],
-    )
-    total = bucket_counts(config, base_rows)
-    safety = bucket_counts(
-        config, [row for row in base_rows if row.get("narrative_type") == "safety"]
-    )
-    concern = bucket_counts(
-        config, [row for row in base_rows if row.get("narrative_type") == "concern"]
-    )
-    reassurance = bucket_counts(
-        config,
-        [
-            row
-            for row in base_rows
-            if row.get("narrative_type") == "safety"
-            and row.get("risk_posture") == "reassurance"
-        ],
-    )
+        freqs,
+        ["product_a", "product_b"],
+        count_columns,
+    )
+    for rows in aggs.values():
+        for row in rows:
+            total_count = row["total_count"]
+            row["safety_ratio"] = (row["safety_count"] / total_count) if total_count else None
+            row["concern_ratio"] = (row["concern_count"] / total_count) if total_count else None
+    return aggs
+
+
+AGGREGATORS = {
+    "documents": _aggregate_documents,
+    "mentions": _aggregate_mentions,
+    "co_mentions": _aggregate_co_mentions,
+    "co_mentions_weighted": _aggregate_weighted_co_mentions,
+    "narratives_weighted": _aggregate_weighted_narratives,
+    "narratives_dimensions": _aggregate_narrative_dimensions,
+    "directional": _aggregate_directional_events,
+    "risk_signals": _aggregate_risk_signals,
+}
+
+
+def _run_aggregation(
+    job: Tuple[str, Path, Sequence[str], NarrativeChangeConfig]
+) -> Tuple[str, object]:
+    """Run one aggregator on its own connection so jobs can execute in worker processes."""
+
+    name, db_path, freqs, change_config = job
+    con = _connect(db_path)
+    try:
+        if name == "narratives":
+            return name, _aggregate_narratives(con, freqs, change_config)
+        return name, AGGREGATORS[name](con, freqs)
+    finally:
+        con.close()
 
-    def _index(rows: List[dict]) -> Dict[tuple, float]:
-        return {
-            (row["product_a"], row["product_b"], row["bucket_start"]): row["count"]
-            for row in rows
-        }
-
-    total_index = _index(total)
-    safety_index = _index(safety)
-    concern_index = _index(concern)
-    reassurance_index = _index(reassurance)
-
-    results: List[dict] = []
-    for key, total_count in total_index.items():
-        product_a, product_b, bucket = key
-        safety_count = safety_index.get(key, 0.0)
-        concern_count = concern_index.get(key, 0.0)
-        reassurance_count = reassurance_index.get(key, 0.0)
-        entry = {
-            "product_a": product_a,
-            "product_b": product_b,
-            "bucket_start": bucket,
-            "total_count": total_count,
-            "safety_count": safety_count,
-            "concern_count": concern_count,
-            "reassurance_count": reassurance_count,
-            "safety_ratio": (safety_count / total_count) if total_count else None,
-            "concern_ratio": (concern_count / total_count) if total_count else None,
-        }
-        results.append(entry)
-
-    results.sort(key=lambda r: (r["product_a"], r["product_b"], r["bucket_start"]))
-    return results
-
-
-def _write_rows(outdir: Path, name: str, frames: Dict[str, List[dict]]) -> None:
-    """Write aggregated rows to disk.
-
-    Attempts to use pandas/pyarrow when available; otherwise falls back to JSON
-    with a parquet extension so downstream tooling can still locate the export.
-    """
 
+def _validation_metrics_for(db_path: Path) -> dict:
+    con = _connect(db_path)
     try:
-        import pandas as pd  # type: ignore
-    except ImportError:
-        pd = None  # type: ignore
-
-    outdir.mkdir(parents=True, exist_ok=True)
-    for freq, rows in frames.items():
-        outfile = outdir / f"{name}_{freq.lower()}.parquet"
-        if pd is None:
-            with outfile.open("w", encoding="utf-8") as f:
-                json.dump(rows, f, default=str)
-        else:
-            df = pd.DataFrame(rows)
-            df.to_parquet(outfile, index=False)
-        print(f"Wrote {outfile} ({len(rows)} rows)")
+        return _validation_metrics(con)
+    finally:
+        con.close()
+
+
+def _write_result(outdir: Path, name: str, result: object) -> None:
+    if name == "narratives":
+        narratives, narrative_changes = result
+        write_rows(outdir, "narratives", narratives)
+        write_rows(outdir, "narratives_change", narrative_changes)
+    else:
+        write_rows(outdir, name, result)
 
 
 def main() -> None:
@@ -471,20 +507,6 @@ def main() -> None:
             f"SQLite database not found at {args.db}. Run ingestion with --db first."
         )
 
-    con = sqlite3.connect(args.db)
-
-    documents: Dict[str, List[dict]] = {}
-    mentions: Dict[str, List[dict]] = {}
-    co_mentions: Dict[str, List[dict]] = {}
-    weighted_co_mentions: Dict[str, List[dict]] = {}
-    narratives: Dict[str, List[dict]] = {}
-    narrative_changes: Dict[str, List[dict]] = {}
-    weighted_narratives: Dict[str, List[dict]] = {}
-    narrative_dimensions: Dict[str, List[dict]] = {}
-    directional: Dict[str, List[dict]] = {}
-    risk_signals: Dict[str, List[dict]] = {}
-    validation: dict = {}
-
     kpi_spec = load_narrative_kpis(args.kpi_config)
     change_min_ratio = (
         args.change_min_ratio
@@ -503,28 +525,23 @@ def main() -> None:
         min_count=change_min_count,
     )
 
-    for freq in args.freq:
-        documents[freq] = _aggregate_documents(con, freq)
-        mentions[freq] = _aggregate_mentions(con, freq)
-        co_mentions[freq] = _aggregate_co_mentions(con, freq)
-        weighted_co_mentions[freq] = _aggregate_weighted_co_mentions(con, freq)
-        narratives[freq], narrative_changes[freq] = _aggregate_narratives(con, freq, change_config)
-        weighted_narratives[freq] = _aggregate_weighted_narratives(con, freq)
-        narrative_dimensions[freq] = _aggregate_narrative_dimensions(con, freq)
-        directional[freq] = _aggregate_directional_events(con, freq)
-        risk_signals[freq] = _aggregate_risk_signals(con, freq)
-    validation = _validation_metrics(con)
-
-    _write_rows(args.outdir, "documents", documents)
-    _write_rows(args.outdir, "mentions", mentions)
-    _write_rows(args.outdir, "co_mentions", co_mentions)
-    _write_rows(args.outdir, "co_mentions_weighted", weighted_co_mentions)
-    _write_rows(args.outdir, "narratives", narratives)
-    _write_rows(args.outdir, "narratives_change", narrative_changes)
-    _write_rows(args.outdir, "narratives_weighted", weighted_narratives)
-    _write_rows(args.outdir, "narratives_dimensions", narrative_dimensions)
-    _write_rows(args.outdir, "directional", directional)
-    _write_rows(args.outdir, "risk_signals", risk_signals)
+    jobs = [
+        (name, args.db, args.freq, change_config)
+        for name in ["narratives", *AGGREGATORS]
+    ]
+    # Outputs are written as each job finishes so serialization overlaps the
+    # aggregations still running in the pool.
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(jobs))) as pool:
+            futures = [pool.submit(_run_aggregation, job) for job in jobs]
+            validation = _validation_metrics_for(args.db)
+            for future in as_completed(futures):
+                _write_result(args.outdir, *future.result())
+    else:
+        for job in jobs:
+            _write_result(args.outdir, *_run_aggregation(job))
+        validation = _validation_metrics_for(args.db)
+
     with (args.outdir / "validation_metrics.json").open("w", encoding="utf-8") as f:
         json.dump(validation, f, indent=2)
     print(f"Wrote validation metrics to {args.outdir / 'validation_metrics.json'}")
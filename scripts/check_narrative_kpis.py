@@ -7,14 +7,26 @@ import csv
 import json
 import sqlite3
 import sys
+from contextlib import closing
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
+try:  # Optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    orjson = None  # type: ignore
+
+try:  # Optional dependency
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    pq = None  # type: ignore
+
 REPO_ROOT_DEFAULT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT_DEFAULT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT_DEFAULT))
 
 from src.analytics.narrative_kpis import NarrativeKPISpec, load_narrative_kpis
+from src.storage import connect_readonly
 
 
 def _resolve(base: Path, candidate: str) -> Path:
@@ -29,15 +41,25 @@ def _assert(condition: bool, message: str) -> None:
         raise SystemExit(message)
 
 
+_BOOL_MAP = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "y": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "n": False,
+}
+
+
 def _parse_bool(value: str | bool | None, *, context: str) -> bool:
     if isinstance(value, bool):
         return value
-    text = (str(value or "")).strip().lower()
-    if text in {"true", "1", "yes", "y"}:
-        return True
-    if text in {"false", "0", "no", "n"}:
-        return False
-    raise SystemExit(f"Row '{context}' lacks a valid is_correct flag (expected true/false).")
+    parsed = _BOOL_MAP.get(str(value or "").strip().lower())
+    if parsed is None:
+        raise SystemExit(f"Row '{context}' lacks a valid is_correct flag (expected true/false).")
+    return parsed
 
 
 def _load_label_sample(path: Path) -> List[dict]:
@@ -62,20 +84,23 @@ def _ensure_label_precision_sample(
         f"Label precision sample has {len(rows)} rows, need {spec.label_precision.sample_size}.",
     )
 
-    totals: Dict[str, List[bool]] = {}
-    correct_flags: List[bool] = []
+    # label -> [correct, total]; labels cover both narrative types and subtypes.
+    totals: Dict[str, List[int]] = {}
+    correct = 0
     for row in rows:
         narrative_type = (row.get("narrative_type") or "").strip().lower()
         narrative_subtype = (row.get("narrative_subtype") or "").strip().lower()
         is_correct = _parse_bool(row.get("is_correct"), context=row.get("sentence_id", "unknown"))
         if not narrative_type:
             raise SystemExit(f"Row '{row}' missing narrative_type.")
-        totals.setdefault(narrative_type, []).append(is_correct)
-        if narrative_subtype:
-            totals.setdefault(narrative_subtype, []).append(is_correct)
-        correct_flags.append(is_correct)
-
-    overall_precision = sum(correct_flags) / len(correct_flags)
+        for label in (narrative_type, narrative_subtype):
+            if label:
+                counts = totals.setdefault(label, [0, 0])
+                counts[0] += is_correct
+                counts[1] += 1
+        correct += is_correct
+
+    overall_precision = correct / len(rows)
     _assert(
         overall_precision >= spec.label_precision.min_precision,
         (
@@ -85,9 +110,9 @@ def _ensure_label_precision_sample(
     )
 
     for label in spec.label_precision.high_risk_types:
-        bucket = totals.get(label.lower())
-        _assert(bucket, f"No sample rows found for high-risk narrative '{label}'. Re-sample before release.")
-        precision = sum(bucket) / len(bucket)
+        counts = totals.get(label.lower())
+        _assert(counts, f"No sample rows found for high-risk narrative '{label}'. Re-sample before release.")
+        precision = counts[0] / counts[1]
         _assert(
             precision >= spec.label_precision.high_risk_min_precision,
             (
@@ -110,15 +135,31 @@ def _read_json_or_raise(path: Path) -> list[dict]:
     return list(data)
 
 
-def _read_table(path: Path) -> Sequence[dict]:
+def _read_table(path: Path, columns: Sequence[str] | None = None) -> Sequence[dict]:
+    """Load a metrics export as row dicts.
+
+    With pyarrow only the requested ``columns`` that exist in the file are read;
+    absent keys simply come back as missing from each row.
+    """
+
+    if not path.exists():
+        raise SystemExit(f"Required metrics file missing: {path}")
+
+    if pq is not None:
+        try:
+            parquet = pq.ParquetFile(path)
+        except Exception:
+            return _read_json_or_raise(path)
+        if columns is not None:
+            available = set(parquet.schema_arrow.names)
+            columns = [name for name in dict.fromkeys(columns) if name in available]
+        return parquet.read(columns=columns).to_pylist()
+
     try:
         import pandas as pd  # type: ignore
     except ImportError:
         pd = None  # type: ignore
 
-    if not path.exists():
-        raise SystemExit(f"Required metrics file missing: {path}")
-
     if pd is None:
         return _read_json_or_raise(path)
 
@@ -135,93 +176,101 @@ def _ensure_change_exports(data_root: Path, export_glob: str, spec: NarrativeKPI
 
     statuses_needing_delta = {"significant_increase", "significant_decrease"}
     new_statuses = {"new"}
+    checked_statuses = statuses_needing_delta | new_statuses
+    status_field = spec.change_significance.status_field
+    min_count = spec.change_significance.min_sentence_count
+    min_delta = spec.change_significance.min_relative_delta
 
     violations: List[str] = []
+    columns = [status_field, "status", "count", "delta_ratio", "narrative_type"]
     for path in matches:
-        rows = _read_table(path)
+        rows = _read_table(path, columns)
         if not rows:
             violations.append(f"{path} is empty.")
             continue
         for row in rows:
-            status = str(
-                row.get(spec.change_significance.status_field)
-                or row.get("status")
-                or ""
-            ).strip()
-            if not status:
+            status = str(row.get(status_field) or row.get("status") or "").strip()
+            if status not in checked_statuses:
                 continue
             count = float(row.get("count") or 0)
-            delta_ratio = row.get("delta_ratio")
             if status in statuses_needing_delta:
-                if count < spec.change_significance.min_sentence_count:
+                delta_ratio = row.get("delta_ratio")
+                if count < min_count:
                     violations.append(
                         f"{path}: {row.get('narrative_type')} count {count} below "
-                        f"{spec.change_significance.min_sentence_count} for status {status}."
+                        f"{min_count} for status {status}."
                     )
-                if delta_ratio is None or abs(float(delta_ratio)) < spec.change_significance.min_relative_delta:
+                if delta_ratio is None or abs(float(delta_ratio)) < min_delta:
                     violations.append(
                         f"{path}: {row.get('narrative_type')} delta {delta_ratio} below "
-                        f"{spec.change_significance.min_relative_delta:.2f}."
-                    )
-            elif status in new_statuses:
-                if count < spec.change_significance.min_sentence_count:
-                    violations.append(
-                        f"{path}: {row.get('narrative_type')} marked NEW with only {count} sentences."
+                        f"{min_delta:.2f}."
                     )
+            elif count < min_count:
+                violations.append(
+                    f"{path}: {row.get('narrative_type')} marked NEW with only {count} sentences."
+                )
     if violations:
         raise SystemExit("Change export validation failed:\n- " + "\n- ".join(violations))
 
 
-def _ensure_confidence_metrics(db_path: Path, spec: NarrativeKPISpec) -> None:
-    if not db_path.exists():
-        raise SystemExit(f"SQLite DB not found at {db_path}.")
-
-    con = sqlite3.connect(db_path)
-    try:
-        cursor = con.execute(
-            """
-            SELECT narrative_type, narrative_subtype, narrative_confidence
+def _normalize_label(value: object) -> str:
+    return str(value).strip().lower()
+
+
+def _ensure_confidence_metrics(con: sqlite3.Connection, spec: NarrativeKPISpec) -> None:
+    # One row per narrative type (in order of first appearance): the top confidence and
+    # the subtype of the first row holding it, the next distinct confidence, and the
+    # highest value below the accepted range. Types are normalized with the same
+    # str.strip().lower() as the other KPI checks; SQLite's trim/lower only handle
+    # spaces and ASCII.
+    con.create_function("normalize_label", 1, _normalize_label, deterministic=True)
+    rows = con.execute(
+        """
+        WITH ranked AS (
+            SELECT normalize_label(narrative_type) AS narrative_type,
+                   narrative_subtype,
+                   narrative_confidence AS confidence,
+                   rowid AS row_order,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY normalize_label(narrative_type)
+                       ORDER BY narrative_confidence DESC, rowid
+                   ) AS rank,
+                   DENSE_RANK() OVER (
+                       PARTITION BY normalize_label(narrative_type)
+                       ORDER BY narrative_confidence DESC
+                   ) AS distinct_rank
             FROM sentence_events
             WHERE narrative_type IS NOT NULL
               AND narrative_confidence IS NOT NULL
-            """
         )
-        rows = cursor.fetchall()
-    finally:
-        con.close()
+        SELECT narrative_type,
+               MAX(CASE WHEN rank = 1 THEN confidence END) AS top_confidence,
+               MAX(CASE WHEN rank = 1 THEN narrative_subtype END) AS top_subtype,
+               MAX(CASE WHEN distinct_rank = 2 THEN confidence END) AS second_confidence,
+               MAX(CASE WHEN confidence < -0.05 THEN confidence END) AS low_outlier
+        FROM ranked
+        GROUP BY narrative_type
+        ORDER BY MIN(row_order)
+        """
+    ).fetchall()
 
     _assert(rows, "sentence_events table has no narrative confidence values; rerun label_sentence_events.py.")
 
-    buckets: Dict[str, List[tuple[float, str | None]]] = {}
-    for narrative_type, narrative_subtype, confidence in rows:
-        if confidence is None:
-            continue
-        normalized_type = str(narrative_type).strip().lower()
-        buckets.setdefault(normalized_type, []).append((float(confidence), narrative_subtype))
-
     violations: List[str] = []
     flag = (spec.confidence_breakdown.low_confidence_flag or "").strip().lower()
 
-    for narrative_type, values in buckets.items():
-        values.sort(key=lambda item: item[0], reverse=True)
-        top_conf = values[0][0]
+    for narrative_type, top_conf, top_subtype, second_conf, low_outlier in rows:
         if top_conf < spec.confidence_breakdown.min_sentence_confidence:
             violations.append(
                 f"{narrative_type} top confidence {top_conf:.2f} below "
                 f"{spec.confidence_breakdown.min_sentence_confidence:.2f}."
             )
 
-        unique_confidences = []
-        for confidence, _ in values:
-            if not unique_confidences or confidence != unique_confidences[-1]:
-                unique_confidences.append(confidence)
-        if len(unique_confidences) > 1:
-            gap = unique_confidences[0] - unique_confidences[1]
+        if second_conf is not None:
+            gap = top_conf - second_conf
         else:
             gap = spec.confidence_breakdown.min_top_gap
-        top_flagged = (
-            values[0][1] and str(values[0][1]).strip().lower() == flag and bool(flag)
-        )
+        top_flagged = top_subtype and str(top_subtype).strip().lower() == flag and bool(flag)
         if gap < spec.confidence_breakdown.min_top_gap and not top_flagged:
             violations.append(
                 f"{narrative_type} confidence gap {gap:.2f} below "
@@ -229,12 +278,11 @@ def _ensure_confidence_metrics(db_path: Path, spec: NarrativeKPISpec) -> None:
             )
 
         if spec.confidence_breakdown.require_sum_to_one:
-            for confidence, _sub in values:
-                if confidence < -0.05 or confidence > 1.05:
-                    violations.append(
-                        f"{narrative_type} confidence {confidence:.2f} falls outside expected 0-1 range."
-                    )
-                    break
+            out_of_range = top_conf if top_conf > 1.05 else low_outlier
+            if out_of_range is not None:
+                violations.append(
+                    f"{narrative_type} confidence {out_of_range:.2f} falls outside expected 0-1 range."
+                )
 
     if violations:
         raise SystemExit("Confidence validation failed:\n- " + "\n- ".join(violations))
@@ -245,7 +293,8 @@ def _ensure_competitive_reference(repo_root: Path, reference_path: str, sample_s
     if not path.exists():
         raise SystemExit(f"Competitive KPI reference file missing at {path}")
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    payload = path.read_bytes()
+    data = orjson.loads(payload) if orjson is not None else json.loads(payload)
     if not isinstance(data, Sequence):
         raise SystemExit(f"Competitive KPI reference file at {path} must be a JSON array.")
     _assert(
@@ -255,11 +304,14 @@ def _ensure_competitive_reference(repo_root: Path, reference_path: str, sample_s
     return list(data)
 
 
+DIRECTIONAL_COLUMNS = ["product", "product_a", "partner", "product_b", "role", "product_role"]
+
+
 def _load_directional_metrics(metrics_dir: Path) -> Sequence[dict]:
     for name in ("directional_w.parquet", "directional_m.parquet"):
         path = metrics_dir / name
         if path.exists():
-            return _read_table(path)
+            return _read_table(path, DIRECTIONAL_COLUMNS)
     raise SystemExit(
         f"No directional metrics found in {metrics_dir}. Expected directional_w.parquet or directional_m.parquet."
     )
@@ -283,8 +335,15 @@ def _ensure_competitive_accuracy(
     )
     metrics_rows = _load_directional_metrics(metrics_dir)
 
-    matches = 0
-    total = len(references)
+    observed = set()
+    for row in metrics_rows:
+        row_product = (_extract_value(row, ("product", "product_a")) or "").strip().lower()
+        row_partner = (_extract_value(row, ("partner", "product_b")) or "").strip().lower()
+        row_role = (_extract_value(row, ("role", "product_role")) or "").strip().lower()
+        if row_product and row_partner and row_role:
+            observed.add((row_product, row_partner, row_role))
+
+    expected = []
     for entry in references:
         pair = entry.get("product_pair") or ""
         if " vs " not in pair:
@@ -293,36 +352,33 @@ def _ensure_competitive_accuracy(
         expected_role = str(entry.get("expected_role") or "").strip().lower()
         if not expected_role:
             raise SystemExit(f"Reference entry for '{pair}' missing expected_role.")
+        expected.append((product, partner, expected_role))
 
-        found = False
-        for row in metrics_rows:
-            row_product = (_extract_value(row, ("product", "product_a")) or "").strip().lower()
-            row_partner = (_extract_value(row, ("partner", "product_b")) or "").strip().lower()
-            row_role = (_extract_value(row, ("role", "product_role")) or "").strip().lower()
-            if not row_product or not row_partner or not row_role:
-                continue
-            if row_product == product and row_partner == partner and row_role == expected_role:
-                found = True
-                break
-        if found:
+    min_accuracy = spec.competitive_direction.min_accuracy
+    total = len(expected)
+    matches = 0
+    label = "Directional role accuracy"
+    for checked, key in enumerate(expected, start=1):
+        if key in observed:
             matches += 1
+        elif (matches + total - checked) / total < min_accuracy:
+            # Fails even if every remaining entry matches, so report that bound.
+            matches += total - checked
+            label = "Directional role accuracy at most"
+            break
 
     accuracy = matches / total if total else 0.0
     _assert(
-        accuracy >= spec.competitive_direction.min_accuracy,
+        accuracy >= min_accuracy,
         (
-            f"Directional role accuracy {accuracy:.2%} below "
-            f"{spec.competitive_direction.min_accuracy:.0%}. "
+            f"{label} {accuracy:.2%} below "
+            f"{min_accuracy:.0%}. "
             "Refresh metrics or update competitive_kpi.json."
         ),
     )
 
 
-def _ensure_narrative_invariants(db_path: Path, spec: NarrativeKPISpec) -> None:
-    if not db_path.exists():
-        raise SystemExit(f"SQLite DB not found at {db_path}.")
-
-    con = sqlite3.connect(db_path)
+def _ensure_narrative_invariants(con: sqlite3.Connection, spec: NarrativeKPISpec) -> None:
     try:
         cursor = con.execute(
             """
@@ -339,8 +395,6 @@ def _ensure_narrative_invariants(db_path: Path, spec: NarrativeKPISpec) -> None:
             "sentence_events table is missing invariant tracking columns. "
             "Re-run label_sentence_events.py to refresh narratives."
         ) from exc
-    finally:
-        con.close()
 
     total_rows = total_rows or 0
     failing_rows = failing_rows or 0
@@ -407,10 +461,13 @@ def main() -> None:
     kpi_spec = load_narrative_kpis(args.kpi_config)
 
     _ensure_label_precision_sample(data_root, kpi_spec.label_precision.sample_export, kpi_spec)
-    _ensure_confidence_metrics(db_path, kpi_spec)
-    _ensure_change_exports(data_root, kpi_spec.change_significance.export_glob, kpi_spec)
-    _ensure_competitive_accuracy(metrics_dir, repo_root, kpi_spec)
-    _ensure_narrative_invariants(db_path, kpi_spec)
+    if not db_path.exists():
+        raise SystemExit(f"SQLite DB not found at {db_path}.")
+    with closing(connect_readonly(db_path)) as con:
+        _ensure_confidence_metrics(con, kpi_spec)
+        _ensure_change_exports(data_root, kpi_spec.change_significance.export_glob, kpi_spec)
+        _ensure_competitive_accuracy(metrics_dir, repo_root, kpi_spec)
+        _ensure_narrative_invariants(con, kpi_spec)
     print("Narrative KPI checks passed.")
 
 
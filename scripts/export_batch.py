@@ -1,7 +1,7 @@
 """Scheduler-friendly batch exporter for weekly aggregates and raw snapshots.
 
 Exports SQLite-backed ingestion results to ``data/exports/`` as both CSV and
-Parquet (when pandas/pyarrow are available). Raw snapshots are trimmed via a
+Parquet (when pyarrow or pandas is available). Raw snapshots are trimmed via a
 retention window while aggregated metrics are retained for longer-term trend
 analysis. Evidence exports include sentiment fields when available.
 """
@@ -11,12 +11,16 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import shutil
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, get_type_hints
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -27,9 +31,23 @@ try:  # Optional dependency
 except ImportError:  # pragma: no cover - handled in code paths
     pd = None  # type: ignore
 
+try:  # Optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    orjson = None  # type: ignore
+
+try:  # Optional dependency
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
 from scripts import aggregate_metrics as aggregator
-from src.analytics import fetch_sentence_evidence, serialize_sentence_evidence
+from src.analytics import SentenceEvidence, iter_sentence_evidence
 from src.analytics.weights import load_study_type_weights
+from src.storage import connect_readonly
+from src.utils.parquet import PARQUET_ROW_GROUP_SIZE
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 DEFAULT_EXPORT_ROOT = Path("data/exports")
@@ -37,6 +55,8 @@ DEFAULT_RAW_RETENTION_DAYS = 30
 DEFAULT_INGEST_RETENTION_DAYS = 14
 DEFAULT_EVIDENCE_LIMIT = 500
 DEFAULT_STUDY_WEIGHT_CONFIG = ROOT / "config" / "study_type_weights.json"
+FETCH_BATCH_SIZE = 10_000
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
 
 RAW_TABLES = [
     "documents",
@@ -98,32 +118,55 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Optional explicit manifest path (defaults to <export-root>/runs/<slug>/manifest.json).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Processes used to export raw tables in parallel (1 exports them inline).",
+    )
     return parser.parse_args()
 
 
-def _rows_from_cursor(cursor: sqlite3.Cursor) -> List[dict]:
+def _rows_from_cursor(cursor: sqlite3.Cursor) -> Iterator[dict]:
+    """Yield result rows as dicts, fetching ``FETCH_BATCH_SIZE`` rows at a time."""
+
     columns: Sequence[str] = [col[0] for col in cursor.description or []]
-    rows = []
-    for raw in cursor.fetchall():
-        row = {col: raw[idx] for idx, col in enumerate(columns)}
-        rows.append(row)
-    return rows
+    for batch in iter(lambda: cursor.fetchmany(FETCH_BATCH_SIZE), []):
+        for raw in batch:
+            yield dict(zip(columns, raw))
+
 
+def _write_csv(
+    rows: Iterable[dict], outfile: Path, fieldnames: Sequence[str] | None = None
+) -> None:
+    """Stream rows to CSV; header defaults to the first row's keys when not given."""
+
+    iterator = iter(rows)
+    if fieldnames is None:
+        first = next(iterator, None)
+        fieldnames = list(first.keys()) if first is not None else []
+        if first is not None:
+            iterator = chain([first], iterator)
 
-def _write_csv(rows: Iterable[dict], outfile: Path) -> None:
-    rows_list = list(rows)
     outfile.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames: Sequence[str] = rows_list[0].keys() if rows_list else []
     with outfile.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows_list:
-            serialized = {k: str(v) if isinstance(v, datetime) else v for k, v in row.items()}
-            writer.writerow(serialized)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        # csv.writer already renders non-string cells with str(), which is the
+        # text the explicit datetime conversion produced.
+        writer.writerows([row.get(k) for k in fieldnames] for row in iterator)
 
 
 def _write_parquet(rows: List[dict], outfile: Path) -> None:
+    """Write rows as zstd parquet, built column-wise with pyarrow when available."""
+
     outfile.parent.mkdir(parents=True, exist_ok=True)
+    if pa is not None:
+        columns = dict.fromkeys(key for row in rows for key in row)
+        table = pa.Table.from_pydict({col: [row.get(col) for row in rows] for col in columns})
+        pq.write_table(table, outfile, compression="zstd", use_dictionary=True)
+        return
+
     if pd is None:
         with outfile.open("w", encoding="utf-8") as f:
             json.dump(rows, f, default=str)
@@ -134,22 +177,199 @@ def _write_parquet(rows: List[dict], outfile: Path) -> None:
     df.to_parquet(outfile, index=False)
 
 
-def _write_jsonl(rows: List[dict], outfile: Path) -> None:
-    outfile.parent.mkdir(parents=True, exist_ok=True)
-    with outfile.open("w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, default=str) + "\n")
+def _json_line(row: dict) -> bytes:
+    """Encode one JSONL record; datetimes go through ``str`` with either encoder."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            row,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return (json.dumps(row, default=str) + "\n").encode("utf-8")
+
+
+def _evidence_schema(rows: List[dict]) -> "pa.Schema":
+    """Infer the evidence parquet schema from the first serialized batch.
+
+    Columns that are all-NULL (or empty lists) in that batch take the type
+    declared on the matching :class:`SentenceEvidence` field, including inside
+    the confidence breakdown, so later batches still fit the writer schema.
+    """
+
+    declared = {
+        Optional[str]: pa.string(),
+        Optional[int]: pa.int64(),
+        Optional[float]: pa.float64(),
+        List[str]: pa.list_(pa.string()),
+        tuple[str, ...]: pa.list_(pa.string()),
+    }
+    hints = {
+        name: declared.get(hint, pa.string())
+        for name, hint in get_type_hints(SentenceEvidence).items()
+    }
+
+    def resolve(field: "pa.Field") -> "pa.Field":
+        if pa.types.is_null(field.type) or (
+            pa.types.is_list(field.type) and pa.types.is_null(field.type.value_type)
+        ):
+            return field.with_type(hints.get(field.name, pa.string()))
+        if pa.types.is_struct(field.type):
+            return field.with_type(pa.struct([resolve(child) for child in field.type]))
+        return field
 
+    return pa.schema([resolve(field) for field in pa.Table.from_pylist(rows).schema])
 
-def _export_query(con: sqlite3.Connection, query: str, base_name: str, outdir: Path) -> dict:
+
+def _write_evidence_batch(writer, rows: List[dict], parquet_path: Path):
+    """Append one row group, opening the writer with the inferred schema on first use."""
+
+    if writer is None:
+        writer = pq.ParquetWriter(
+            parquet_path, _evidence_schema(rows), compression="zstd", use_dictionary=True
+        )
+    writer.write_table(pa.Table.from_pylist(rows, schema=writer.schema))
+    return writer
+
+
+def _write_evidence_files(
+    rows: Iterable[dict], csv_path: Path, jsonl_path: Path, parquet_path: Path
+) -> int:
+    """Write evidence rows to CSV, JSONL and parquet in a single pass; return the row count.
+
+    The CSV header follows the first row. With pyarrow, parquet is written one
+    row group at a time; otherwise the rows are collected for :func:`_write_parquet`.
+    """
+
+    iterator = iter(rows)
+    first = next(iterator, None)
+    fieldnames: Sequence[str] = list(first.keys()) if first is not None else []
+    if first is not None:
+        iterator = chain([first], iterator)
+    pending: List[dict] = []
+    total = 0
+    writer = None
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with csv_path.open("w", newline="", encoding="utf-8") as csv_file, jsonl_path.open(
+            "wb"
+        ) as jsonl_file:
+            out = csv.writer(csv_file)
+            out.writerow(fieldnames)
+            for row in iterator:
+                out.writerow([row.get(k) for k in fieldnames])
+                jsonl_file.write(_json_line(row))
+                pending.append(row)
+                total += 1
+                if pa is not None and len(pending) == PARQUET_ROW_GROUP_SIZE:
+                    writer = _write_evidence_batch(writer, pending, parquet_path)
+                    pending = []
+            if pa is not None and pending:
+                writer = _write_evidence_batch(writer, pending, parquet_path)
+                pending = []
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        _write_parquet(pending, parquet_path)
+    return total
+
+
+def _table_schema(con: sqlite3.Connection, table: str) -> "pa.Schema":
+    """Map a table's declared SQLite column types onto an Arrow schema.
+
+    INTEGER and REAL affinities become int64 and float64; everything else is
+    exported as string.
+    """
+
+    fields = []
+    for _, name, declared, *_ in con.execute(f"PRAGMA table_info({table})"):
+        affinity = (declared or "").upper()
+        if "INT" in affinity:
+            arrow_type = pa.int64()
+        elif any(token in affinity for token in ("REAL", "FLOA", "DOUB")):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _stream_export(
+    batches: Iterable[List[tuple]], schema: "pa.Schema", csv_path: Path, parquet_path: Path
+) -> int:
+    """Write row batches to CSV and to one parquet row group each; return the row count.
+
+    The parquet schema is fixed up front from the declared column types, so each
+    batch is written as soon as it is fetched.
+    """
+
+    total = 0
+    fieldnames = schema.names
+    with csv_path.open("w", newline="", encoding="utf-8") as f, pq.ParquetWriter(
+        parquet_path, schema, compression="zstd", use_dictionary=True
+    ) as writer:
+        out = csv.writer(f)
+        out.writerow(fieldnames)
+        for batch in batches:
+            out.writerows(batch)
+            total += len(batch)
+            columns = dict(zip(fieldnames, map(list, zip(*batch))))
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+    return total
+
+
+def _export_query(
+    con: sqlite3.Connection,
+    query: str,
+    base_name: str,
+    outdir: Path,
+    *,
+    schema: "pa.Schema | None" = None,
+) -> dict:
     cur = con.execute(query)
-    rows = _rows_from_cursor(cur)
+    fieldnames = [col[0] for col in cur.description or []]
     csv_path = outdir / f"{base_name}.csv"
     parquet_path = outdir / f"{base_name}.parquet"
-    _write_csv(rows, csv_path)
-    _write_parquet(rows, parquet_path)
-    print(f"Exported {len(rows)} rows to {csv_path} and {parquet_path}")
-    return {"csv": str(csv_path), "parquet": str(parquet_path), "rows": len(rows)}
+    if schema is not None:
+        outdir.mkdir(parents=True, exist_ok=True)
+        batches = iter(lambda: cur.fetchmany(PARQUET_ROW_GROUP_SIZE), [])
+        try:
+            total = _stream_export(batches, schema, csv_path, parquet_path)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+            # SQLite only enforces type affinity, so a stray value can break the
+            # declared types; redo the whole export with every column as text.
+            print(f"{base_name}: value outside declared column types ({exc}); exporting as strings")
+            cur = con.execute(query)
+            text_batches = (
+                [tuple(None if value is None else str(value) for value in row) for row in batch]
+                for batch in iter(lambda: cur.fetchmany(PARQUET_ROW_GROUP_SIZE), [])
+            )
+            text_schema = pa.schema([pa.field(name, pa.string()) for name in schema.names])
+            total = _stream_export(text_batches, text_schema, csv_path, parquet_path)
+    else:
+        rows = list(_rows_from_cursor(cur))
+        _write_csv(rows, csv_path, fieldnames)
+        _write_parquet(rows, parquet_path)
+        total = len(rows)
+    print(f"Exported {total} rows to {csv_path} and {parquet_path}")
+    return {"csv": str(csv_path), "parquet": str(parquet_path), "rows": total}
+
+
+def _export_table(job: Tuple[Path, str, Path]) -> Tuple[str, dict]:
+    """Export one raw table on its own read-only connection so it can run in a worker process."""
+
+    db_path, table, outdir = job
+    con = connect_readonly(db_path)
+    try:
+        schema = _table_schema(con, table) if pa is not None else None
+        return table, _export_query(
+            con, f"SELECT * FROM {table}", base_name=table, outdir=outdir, schema=schema
+        )
+    finally:
+        con.close()
 
 
 def _aggregate_frames(
@@ -158,28 +378,17 @@ def _aggregate_frames(
     *,
     change_config: aggregator.NarrativeChangeConfig | None = None,
 ) -> Dict[str, Dict[str, List[dict]]]:
-    aggregates: Dict[str, Dict[str, List[dict]]] = {
-        "documents": {},
-        "mentions": {},
-        "co_mentions": {},
-        "co_mentions_weighted": {},
-        "narratives": {},
-        "narratives_change": {},
-        "directional": {},
-    }
     config = change_config or aggregator.NarrativeChangeConfig()
-    for freq in freqs:
-        aggregates["documents"][freq] = aggregator._aggregate_documents(con, freq)
-        aggregates["mentions"][freq] = aggregator._aggregate_mentions(con, freq)
-        aggregates["co_mentions"][freq] = aggregator._aggregate_co_mentions(con, freq)
-        aggregates["co_mentions_weighted"][freq] = aggregator._aggregate_weighted_co_mentions(
-            con, freq
-        )
-        narrative_rows, change_rows = aggregator._aggregate_narratives(con, freq, config)
-        aggregates["narratives"][freq] = narrative_rows
-        aggregates["narratives_change"][freq] = change_rows
-        aggregates["directional"][freq] = aggregator._aggregate_directional_events(con, freq)
-    return aggregates
+    narrative_rows, change_rows = aggregator._aggregate_narratives(con, freqs, config)
+    return {
+        "documents": aggregator._aggregate_documents(con, freqs),
+        "mentions": aggregator._aggregate_mentions(con, freqs),
+        "co_mentions": aggregator._aggregate_co_mentions(con, freqs),
+        "co_mentions_weighted": aggregator._aggregate_weighted_co_mentions(con, freqs),
+        "narratives": narrative_rows,
+        "narratives_change": change_rows,
+        "directional": aggregator._aggregate_directional_events(con, freqs),
+    }
 
 
 def _export_aggregates(
@@ -212,11 +421,11 @@ def _export_evidence(
     study_weight_lookup: Dict[str, float] | None,
 ) -> dict:
     outdir.mkdir(parents=True, exist_ok=True)
-    evidence_rows = fetch_sentence_evidence(con, limit=limit)
-    serialized = serialize_sentence_evidence(
-        evidence_rows,
-        study_weight_lookup=study_weight_lookup,
-        include_confidence=True,
+    # Rows are serialized as the cursor yields them, so the evidence dataclasses
+    # never accumulate alongside their dict form.
+    serialized_rows = (
+        row.to_dict(study_weight_lookup=study_weight_lookup, include_confidence=True)
+        for row in iter_sentence_evidence(con, limit=limit)
     )
 
     base_name = f"sentence_evidence_{run_slug}"
@@ -224,16 +433,14 @@ def _export_evidence(
     parquet_path = outdir / f"{base_name}.parquet"
     jsonl_path = outdir / f"{base_name}.jsonl"
 
-    _write_csv(serialized, csv_path)
-    _write_parquet(serialized, parquet_path)
-    _write_jsonl(serialized, jsonl_path)
+    total = _write_evidence_files(serialized_rows, csv_path, jsonl_path, parquet_path)
 
-    print(f"Exported {len(serialized)} evidence rows -> {csv_path}")
+    print(f"Exported {total} evidence rows -> {csv_path}")
     return {
         "csv": str(csv_path),
         "parquet": str(parquet_path),
         "jsonl": str(jsonl_path),
-        "rows": len(serialized),
+        "rows": total,
     }
 
 
@@ -295,15 +502,17 @@ def _prune_retention(target: Path, retention_days: int) -> List[Path]:
     if retention_days <= 0 or not target.exists():
         return []
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).timestamp()
     removed: List[Path] = []
-    for child in target.iterdir():
-        mtime = datetime.fromtimestamp(child.stat().st_mtime, tz=timezone.utc)
-        if mtime < cutoff:
-            if child.is_dir():
-                shutil.rmtree(child)
+    with os.scandir(target) as entries:
+        for entry in entries:
+            if entry.stat().st_mtime >= cutoff:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry.path)
             else:
-                child.unlink()
+                os.unlink(entry.path)
+            child = Path(entry.path)
             removed.append(child)
             print(f"Pruned old artifact: {child}")
     return removed
@@ -322,6 +531,7 @@ def run_export(
     manifest_path: Path | None = None,
     evidence_limit: int = DEFAULT_EVIDENCE_LIMIT,
     study_weight_lookup: Dict[str, float] | None = None,
+    workers: int = DEFAULT_WORKERS,
 ) -> dict:
     run_ts = now or datetime.now(timezone.utc)
     resolved_slug = run_slug or run_ts.strftime("run_%Y%m%d")
@@ -337,26 +547,37 @@ def run_export(
     run_dir.mkdir(parents=True, exist_ok=True)
     aggregates_dir.mkdir(parents=True, exist_ok=True)
 
-    con = sqlite3.connect(db_path)
-    con.row_factory = sqlite3.Row
+    # Raw tables are independent full scans, so they are exported in worker
+    # processes while the aggregates and evidence are built on this connection.
+    raw_jobs = [(db_path, table, raw_export_dir) for table in RAW_TABLES]
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(raw_jobs))) if workers > 1 else None
+    try:
+        futures = [pool.submit(_export_table, job) for job in raw_jobs] if pool else []
+
+        with closing(connect_readonly(db_path)) as con:
+            con.row_factory = sqlite3.Row
+
+            aggregates = _aggregate_frames(con, freqs)
+            aggregate_exports = _export_aggregates(aggregates, aggregates_dir, resolved_slug)
+            evidence_exports = _export_evidence(
+                con,
+                evidence_dir,
+                run_slug=resolved_slug,
+                limit=evidence_limit,
+                study_weight_lookup=study_weight_lookup,
+            )
 
-    aggregates = _aggregate_frames(con, freqs)
-    aggregate_exports = _export_aggregates(aggregates, aggregates_dir, resolved_slug)
-    evidence_exports = _export_evidence(
-        con,
-        evidence_dir,
-        run_slug=resolved_slug,
-        limit=evidence_limit,
-        study_weight_lookup=study_weight_lookup,
-    )
+            if pool is not None:
+                raw_results = [future.result() for future in futures]
+            else:
+                raw_results = [_export_table(job) for job in raw_jobs]
+            raw_exports: Dict[str, dict] = dict(raw_results)
 
-    raw_exports: Dict[str, dict] = {}
-    for table in RAW_TABLES:
-        raw_exports[table] = _export_query(
-            con, f"SELECT * FROM {table}", base_name=table, outdir=raw_export_dir
-        )
+            consistency = _validate_consistency(con, aggregates)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
-    consistency = _validate_consistency(con, aggregates)
     manifest = {
         "run_id": resolved_slug,
         "run_at": run_ts.isoformat(),
@@ -369,8 +590,15 @@ def run_export(
     }
 
     manifest_target = manifest_path or (run_dir / "manifest.json")
-    with manifest_target.open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    # Write to a sibling temp file and swap it in so schedulers polling the
+    # manifest never read a partially written file.
+    if orjson is not None:
+        payload = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(manifest, indent=2).encode("utf-8")
+    manifest_tmp = manifest_target.with_name(f"{manifest_target.name}.tmp")
+    manifest_tmp.write_bytes(payload)
+    os.replace(manifest_tmp, manifest_target)
     print(f"Wrote manifest to {manifest_target}")
     manifest["manifest_path"] = str(manifest_target)
 
@@ -395,6 +623,7 @@ def main() -> None:
         manifest_path=args.manifest_path,
         evidence_limit=args.evidence_limit,
         study_weight_lookup=study_weight_lookup,
+        workers=args.workers,
     )
 
 
@@ -6,11 +6,17 @@ import argparse
 import csv
 import random
 import sqlite3
+import sys
 from pathlib import Path
 from typing import List, Sequence
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from src.analytics.narrative_kpis import load_narrative_kpis
 from src.analytics.sections import normalize_section
+from src.storage import connect_readonly
 
 
 def _normalize_allowed_sections(values: Sequence[str] | None) -> set[str] | None:
@@ -35,7 +41,7 @@ def _has_sentence_event_section(conn: sqlite3.Connection) -> bool:
 def _fetch_candidates(conn: sqlite3.Connection, allowed_sections: set[str] | None = None) -> List[dict]:
     se_has_section = _has_sentence_event_section(conn)
     section_expr = "se.section" if se_has_section else "NULL"
-    rows = conn.execute(
+    cursor = conn.execute(
         f"""
         SELECT se.sentence_id,
                se.narrative_type,
@@ -54,10 +60,10 @@ def _fetch_candidates(conn: sqlite3.Connection, allowed_sections: set[str] | Non
                ON se.doc_id = d.doc_id
         WHERE se.narrative_type IS NOT NULL
         """
-    ).fetchall()
+    )
 
     results = []
-    for row in rows:
+    for row in cursor:
         (
             sentence_id,
             narrative_type,
@@ -104,26 +110,24 @@ def _stratified_sample(
             continue
         buckets.setdefault(narrative_type, []).append(row)
 
-    for bucket in buckets.values():
-        rng.shuffle(bucket)
-
     sample: List[dict] = []
     for required in required_types:
         key = required.lower()
         bucket = buckets.get(key, [])
         if not bucket:
             continue
+        # Swap a random pick to the end so it can be popped without shuffling the bucket.
+        idx = rng.randrange(len(bucket))
+        bucket[idx], bucket[-1] = bucket[-1], bucket[idx]
         sample.append(bucket.pop())
 
     if len(sample) > sample_size:
         return sample[:sample_size]
 
-    remaining = [
-        row for bucket_rows in buckets.values() for row in bucket_rows if row not in sample
-    ]
-    rng.shuffle(remaining)
+    # Required picks were popped from their buckets, so what is left is the remainder.
+    remaining = [row for bucket_rows in buckets.values() for row in bucket_rows]
     needed = sample_size - len(sample)
-    sample.extend(remaining[:needed])
+    sample.extend(rng.sample(remaining, min(needed, len(remaining))))
     return sample
 
 
@@ -141,16 +145,12 @@ def _write_sample(path: Path, rows: Sequence[dict]) -> None:
         "narrative_confidence",
         "is_correct",
     ]
+    row_fields = fieldnames[:-1]
     with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    **{name: row.get(name) for name in fieldnames if name in row},
-                    "is_correct": "",
-                }
-            )
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        # is_correct is left blank for reviewers to fill in.
+        writer.writerows([*(row.get(name) for name in row_fields), ""] for row in rows)
 
 
 def parse_args() -> argparse.Namespace:
@@ -217,7 +217,7 @@ def main() -> None:
     rng = random.Random(args.seed)
 
     allowed_sections = _normalize_allowed_sections(args.allowed_sections)
-    conn = sqlite3.connect(args.db)
+    conn = connect_readonly(args.db)
     try:
         rows = _fetch_candidates(conn, allowed_sections=allowed_sections)
     finally:
@@ -237,11 +237,12 @@ def main() -> None:
         }
         missing_subtypes = require_subtypes - present_subtypes
         if missing_subtypes:
+            sampled = {id(row) for row in sample}
             subtype_rows = [
                 row
                 for row in rows
                 if (row.get("narrative_subtype") or "").strip().lower() in missing_subtypes
-                and row not in sample
+                and id(row) not in sampled
             ]
             sample.extend(subtype_rows)
     _write_sample(args.output, sample)
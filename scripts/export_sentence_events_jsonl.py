@@ -4,11 +4,23 @@ from __future__ import annotations
 
 import argparse
 import json
-import sqlite3
+import sys
 from pathlib import Path
 
+try:  # Optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    orjson = None  # type: ignore
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.storage import connect_readonly
+
 DEFAULT_DB = Path("data/europepmc.sqlite")
 DEFAULT_OUTPUT = Path("data/processed/sentence_events_for_sentiment.jsonl")
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def parse_args() -> argparse.Namespace:
@@ -28,33 +40,42 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _json_line(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def export_sentence_events(db_path: Path, output_path: Path) -> int:
     if not db_path.exists():
         raise SystemExit(f"SQLite database not found at {db_path}")
 
-    conn = sqlite3.connect(db_path)
+    conn = connect_readonly(db_path)
     query = (
         "SELECT se.doc_id, se.sentence_id, se.product_a, se.product_b, s.text "
         "FROM sentence_events se "
         "JOIN sentences s ON se.sentence_id = s.sentence_id "
         "WHERE se.doc_id IS NOT NULL"
     )
-    rows = conn.execute(query).fetchall()
-    conn.close()
-
+    count = 0
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as fh:
-        for doc_id, sentence_id, product_a, product_b, text in rows:
-            payload = {
-                "doc_id": doc_id,
-                "sentence_id": sentence_id,
-                "product_a": product_a,
-                "product_b": product_b,
-                "sentence_text": text,
-            }
-            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
-
-    return len(rows)
+    try:
+        cursor = conn.execute(query)
+        with output_path.open("wb", buffering=WRITE_BUFFER_SIZE) as fh:
+            for doc_id, sentence_id, product_a, product_b, text in cursor:
+                payload = {
+                    "doc_id": doc_id,
+                    "sentence_id": sentence_id,
+                    "product_a": product_a,
+                    "product_b": product_b,
+                    "sentence_text": text,
+                }
+                fh.write(_json_line(payload))
+                count += 1
+    finally:
+        conn.close()
+
+    return count
 
 
 def main() -> None:
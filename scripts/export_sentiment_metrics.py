@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sqlite3
 import sys
 from pathlib import Path
 from typing import Dict, List
 
-from src.analytics.time_series import sentiment_bucket_counts
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.analytics.time_series import add_sentiment_ratios, bucketed_rows, sql_bucket_start
+from src.storage import connect_readonly
+from src.utils.parquet import write_rows
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 DEFAULT_OUTDIR = Path("data/processed/metrics")
@@ -39,57 +44,38 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _load_rows(con: sqlite3.Connection) -> List[dict]:
-    con.row_factory = sqlite3.Row
-    cur = con.execute(
-        """
-        SELECT d.publication_date,
-               se.product_a,
+def _aggregate_sentiment(con: sqlite3.Connection, freq: str) -> List[dict]:
+    """Bucket and count sentiment labels per product pair inside SQLite.
+
+    Only the grouped bucket rows cross into Python; :func:`add_sentiment_ratios`
+    then derives the per-bucket shares exactly as ``sentiment_bucket_counts`` did.
+    """
+
+    cur = con.cursor()
+    cur.row_factory = None
+    cur.execute(
+        f"""
+        SELECT se.product_a,
                se.product_b,
-               se.sentiment_label
+               se.sentiment_label,
+               {sql_bucket_start("d.publication_date", freq)} AS bucket_start,
+               COUNT(*) AS count
         FROM sentence_events se
         JOIN documents d ON se.doc_id = d.doc_id
         WHERE d.publication_date IS NOT NULL
           AND se.sentiment_label IS NOT NULL
+        GROUP BY se.product_a, se.product_b, se.sentiment_label, bucket_start
         """
     )
-    return [dict(row) for row in cur.fetchall()]
-
-
-def _aggregate_sentiment(rows: List[dict], freq: str) -> List[dict]:
-    return sentiment_bucket_counts(
+    columns = [col[0] for col in cur.description]
+    rows = bucketed_rows(dict(zip(columns, values)) for values in cur)
+    return add_sentiment_ratios(
         rows,
-        timestamp_column="publication_date",
         label_column="sentiment_label",
-        freq=freq,
         group_columns=["product_a", "product_b"],
     )
 
 
-def _write_rows(outdir: Path, name: str, frames: Dict[str, List[dict]]) -> None:
-    """Write aggregated rows to disk.
-
-    Attempts to use pandas/pyarrow when available; otherwise falls back to JSON
-    with a parquet extension so downstream tooling can still locate the export.
-    """
-
-    try:
-        import pandas as pd  # type: ignore
-    except ImportError:
-        pd = None  # type: ignore
-
-    outdir.mkdir(parents=True, exist_ok=True)
-    for freq, rows in frames.items():
-        outfile = outdir / f"{name}_{freq.lower()}.parquet"
-        if pd is None:
-            with outfile.open("w", encoding="utf-8") as f:
-                json.dump(rows, f, default=str)
-        else:
-            df = pd.DataFrame(rows)
-            df.to_parquet(outfile, index=False)
-        print(f"Wrote {outfile} ({len(rows)} rows)")
-
-
 def main() -> None:
     args = parse_args()
 
@@ -98,19 +84,20 @@ def main() -> None:
             f"SQLite database not found at {args.db}. Run ingestion with --db first."
         )
 
-    con = sqlite3.connect(args.db)
-    rows = _load_rows(con)
-    if not rows:
+    sentiment: Dict[str, List[dict]] = {}
+    con = connect_readonly(args.db)
+    try:
+        for freq in args.freq:
+            sentiment[freq] = _aggregate_sentiment(con, freq)
+    finally:
+        con.close()
+    if not any(sentiment.values()):
         print(
             "Warning: no sentiment rows found. Ensure ingestion stored sentiment labels.",
             file=sys.stderr,
         )
 
-    sentiment: Dict[str, List[dict]] = {}
-    for freq in args.freq:
-        sentiment[freq] = _aggregate_sentiment(rows, freq)
-
-    _write_rows(args.outdir, "sentiment", sentiment)
+    write_rows(args.outdir, "sentiment", sentiment)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import argparse
 import csv
-import sqlite3
+import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from src.analytics.sections import normalize_section
+from src.storage import connect_readonly
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -27,10 +32,11 @@ def parse_args() -> argparse.Namespace:
 
 
 ALLOWED_SECTIONS = {"results", "result", "conclusion", "conclusions", "discussion"}
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def export_unlabeled(db_path: Path, output_path: Path) -> int:
-    conn = sqlite3.connect(db_path)
+    conn = connect_readonly(db_path)
     query = """
         SELECT
             cms.doc_id,
@@ -57,43 +63,6 @@ def export_unlabeled(db_path: Path, output_path: Path) -> int:
            OR se.narrative_invariant_ok = 0
         ORDER BY cms.doc_id, cms.sentence_id
     """
-    rows = conn.execute(query).fetchall()
-    conn.close()
-
-    filtered_rows = []
-    for (
-        doc_id,
-        sentence_id,
-        product_a,
-        product_b,
-        section,
-        sentence_text,
-        narrative_type,
-        narrative_subtype,
-        narrative_confidence,
-        narrative_invariant_ok,
-        narrative_invariant_reason,
-    ) in rows:
-        canonical_section, _, _ = normalize_section(section, sentence_text)
-        normalized = (canonical_section or "").lower()
-        if normalized not in ALLOWED_SECTIONS:
-            continue
-        filtered_rows.append(
-            (
-                doc_id,
-                sentence_id,
-                product_a,
-                product_b,
-                canonical_section,
-                sentence_text,
-                narrative_type,
-                narrative_subtype,
-                narrative_confidence,
-                narrative_invariant_ok,
-                narrative_invariant_reason,
-            )
-        )
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = [
         "doc_id",
@@ -108,11 +77,50 @@ def export_unlabeled(db_path: Path, output_path: Path) -> int:
         "narrative_invariant_ok",
         "narrative_invariant_reason",
     ]
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(fieldnames)
-        writer.writerows(filtered_rows)
-    return len(filtered_rows)
+    count = 0
+    try:
+        cursor = conn.execute(query)
+        with output_path.open(
+            "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for (
+                doc_id,
+                sentence_id,
+                product_a,
+                product_b,
+                section,
+                sentence_text,
+                narrative_type,
+                narrative_subtype,
+                narrative_confidence,
+                narrative_invariant_ok,
+                narrative_invariant_reason,
+            ) in cursor:
+                canonical_section, _, _ = normalize_section(section, sentence_text)
+                normalized = (canonical_section or "").lower()
+                if normalized not in ALLOWED_SECTIONS:
+                    continue
+                writer.writerow(
+                    (
+                        doc_id,
+                        sentence_id,
+                        product_a,
+                        product_b,
+                        canonical_section,
+                        sentence_text,
+                        narrative_type,
+                        narrative_subtype,
+                        narrative_confidence,
+                        narrative_invariant_ok,
+                        narrative_invariant_reason,
+                    )
+                )
+                count += 1
+    finally:
+        conn.close()
+    return count
 
 
 def main() -> None:
@@ -11,6 +11,15 @@ from typing import Dict, List
 DEFAULT_BUNDLE = Path("data/releases/run_20260108")
 DEFAULT_NOTES = Path("data/releases/run_20260108/release_notes.md")
 
+# Checked in order; the first marker found in the lowercased path wins.
+ARTIFACT_LABELS = (
+    ("phase1_run_manifest", "Manifest"),
+    ("latest_sentence_events", "Latest sentence events"),
+    ("narratives_label_kpi", "Narratives KPI sample"),
+    ("narratives_unlabeled", "Narratives unlabeled audit"),
+    ("narratives_change", "Narratives change export"),
+)
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -43,27 +52,15 @@ def _load_summary(bundle_dir: Path) -> Dict:
 
 def _markdown_table(rows: List[Dict[str, str]]) -> str:
     header = "| Artifact | Release Path | SHA-256 |\n| --- | --- | --- |"
-    lines = [header]
-    for row in rows:
-        name = row["label"]
-        path = row["release_path"]
-        sha = row["sha256"]
-        lines.append(f"| {name} | `{path}` | `{sha}` |")
-    return "\n".join(lines)
+    body = (f"| {row['label']} | `{row['release_path']}` | `{row['sha256']}` |" for row in rows)
+    return "\n".join([header, *body])
 
 
 def _classify(rel_path: str) -> str:
     lower = rel_path.lower()
-    if "phase1_run_manifest" in lower:
-        return "Manifest"
-    if "latest_sentence_events" in lower:
-        return "Latest sentence events"
-    if "narratives_label_kpi" in lower:
-        return "Narratives KPI sample"
-    if "narratives_unlabeled" in lower:
-        return "Narratives unlabeled audit"
-    if "narratives_change" in lower:
-        return "Narratives change export"
+    for marker, label in ARTIFACT_LABELS:
+        if marker in lower:
+            return label
     if lower.endswith("narratives_kpis.json"):
         return "KPI config"
     return Path(rel_path).name
@@ -6,15 +6,24 @@ import argparse
 import inspect
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterable, Iterator, List, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 import json
+
+try:  # Optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    orjson = None  # type: ignore
+
 from src.analytics import (
     MentionExtractor,
     ProductMention,
@@ -27,13 +36,14 @@ from src.analytics import (
 )
 from src.analytics.indication_extractor import IndicationExtractor, load_indication_config
 from src.ingestion.europe_pmc_client import EuropePMCClient, EuropePMCQuery
+from src.ingestion.models import EuropePMCSearchResult
 from src.storage import (
     get_ingest_status,
     init_db,
     insert_co_mentions,
     insert_co_mentions_sentences,
-    insert_mentions,
-    insert_sentence_indications,
+    insert_document_indications,
+    insert_document_mentions,
     insert_sentences,
     update_ingest_status,
     upsert_document,
@@ -47,12 +57,93 @@ RAW_DIR = Path("data/raw")
 PROCESSED_DIR = Path("data/processed")
 STUDY_WEIGHT_CONFIG = ROOT / "config" / "study_type_weights.json"
 INDICATION_CONFIG = ROOT / "config" / "indications.json"
+WRITE_BUFFER_SIZE = 1 << 20
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+SPLIT_CHUNKSIZE = 8
+
+_SPLIT_TASK = None
 
 
 def _slug(text: str) -> str:
     return "_".join(text.lower().split())
 
 
+def _json_line(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+def _stream_raw(
+    f: BinaryIO, records: Iterable[EuropePMCSearchResult]
+) -> Iterator[EuropePMCSearchResult]:
+    """Write each record's raw payload into one compact JSON array as it passes through."""
+
+    f.write(b"[")
+    for idx, record in enumerate(records):
+        if idx:
+            f.write(b",")
+        if orjson is not None:
+            f.write(orjson.dumps(record.raw))
+        else:
+            f.write(json.dumps(record.raw).encode("utf-8"))
+        yield record
+    f.write(b"]")
+
+
+def _split_and_extract(
+    splitter: SentenceSplitter,
+    mention_extractor: MentionExtractor | None,
+    indication_extractor: IndicationExtractor | None,
+    sentence_cap: int,
+    record: EuropePMCSearchResult,
+):
+    """Split ``record`` and run the extractors over the sentences the ingest loop keeps.
+
+    Returns the document and one ``(mentions, indications)`` pair per kept sentence;
+    the pairs are empty when there is nothing to extract.
+    """
+
+    doc = splitter.split_document(record)
+    extracted = []
+    if mention_extractor is None and indication_extractor is None:
+        return doc, extracted
+    for idx, sentence in enumerate(doc.iter_sentences()):
+        if sentence_cap and idx >= sentence_cap:
+            break
+        extracted.append(
+            (
+                mention_extractor.extract(sentence.text) if mention_extractor else [],
+                indication_extractor.extract(sentence.text) if indication_extractor else [],
+            )
+        )
+    return doc, extracted
+
+
+def _init_split_worker(
+    mention_extractor: MentionExtractor | None,
+    indication_extractor: IndicationExtractor | None,
+    sentence_cap: int,
+) -> None:
+    """Build one splitter per worker process instead of pickling it per task."""
+
+    global _SPLIT_TASK
+    _SPLIT_TASK = partial(
+        _split_and_extract, SentenceSplitter(), mention_extractor, indication_extractor, sentence_cap
+    )
+
+
+def _split_in_worker(record: EuropePMCSearchResult):
+    return _SPLIT_TASK(record)
+
+
+@lru_cache(maxsize=None)
+def _init_params(cls: type) -> frozenset[str]:
+    """Keyword names accepted by ``cls.__init__``, inspected once per class."""
+
+    return frozenset(inspect.signature(cls.__init__).parameters)
+
+
 def _env_flag(name: str) -> bool:
     value = os.getenv(name)
     if value is None:
@@ -222,6 +313,12 @@ def parse_args() -> argparse.Namespace:
             "Use for Phase 2 guardrail runs."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Processes used to split documents into sentences (1 splits them inline).",
+    )
     return parser.parse_args()
 
 
@@ -361,7 +458,7 @@ def run_ingestion(
         print(f"Using custom proxy overrides for Europe PMC requests: {proxy_keys}.")
 
     client_kwargs = {"polite_delay_s": args.polite_delay}
-    init_params = inspect.signature(EuropePMCClient.__init__).parameters
+    init_params = _init_params(EuropePMCClient)
     if "trust_env" in init_params:
         client_kwargs["trust_env"] = not no_proxy
     if "proxies" in init_params:
@@ -371,6 +468,9 @@ def run_ingestion(
         print("Using legacy page-based pagination for Europe PMC requests.")
 
     client = client or EuropePMCClient(**client_kwargs)
+    # A caller-supplied splitter may carry a custom pipeline, so only the
+    # default one is rebuilt inside worker processes.
+    split_in_workers = splitter is None
     splitter = splitter or SentenceSplitter()
 
     expand_aliases = bool(getattr(args, "expand_query_aliases", False))
@@ -442,48 +542,76 @@ def run_ingestion(
         print(f"No Europe PMC results returned for query: {query.query}")
         print("Check product spelling, relax date filters, or rerun without --exclude flags.")
 
-        with raw_path.open("w", encoding="utf-8") as f:
-            json.dump([], f, indent=2)
+        raw_path.write_bytes(b"[]")
 
         structured_path.touch()
         print(f"Raw records written to: {raw_path}")
         print(f"Structured documents written to: {structured_path}")
         return
 
-    raw_results = list(
-        client.search(
-            query,
-            max_records=args.max_records,
-            initial_payload=first_page,
-            use_cursor=cursor_mode,
+    # Deduplication merges later duplicates into earlier records, so it still
+    # needs the whole result set; the raw payloads are written as they arrive
+    # rather than kept in a second list. They go to a sibling temp file that is
+    # swapped in once the search completes, so a failed run never leaves a
+    # truncated raw file behind.
+    raw_tmp = raw_path.with_name(f"{raw_path.name}.tmp")
+    with raw_tmp.open("wb", buffering=WRITE_BUFFER_SIZE) as raw_file:
+        normalized_results, dedup_stats = normalize_and_deduplicate(
+            _stream_raw(
+                raw_file,
+                client.search(
+                    query,
+                    max_records=args.max_records,
+                    initial_payload=first_page,
+                    use_cursor=cursor_mode,
+                ),
+            )
         )
-    )
-
-    normalized_results, dedup_stats = normalize_and_deduplicate(raw_results)
+    os.replace(raw_tmp, raw_path)
 
-    with raw_path.open("w", encoding="utf-8") as f:
-        json.dump([r.raw for r in raw_results], f, indent=2)
-
-    documents = []
+    first_document = None
+    latest_key: Optional[tuple] = None
+    latest_pmid = None
     skipped_comention_docs = 0
-    with structured_path.open("w", encoding="utf-8") as f:
-        for record in normalized_results:
-            doc = splitter.split_document(record)
-            should_process_sentences = conn is not None or require_comentions
+    should_process_sentences = conn is not None or require_comentions
+    max_sentences = getattr(args, "max_sentences_per_doc", 0) or 0
+    max_pairs = getattr(args, "max_co_mentions_per_sentence", 0) or 0
+    sentence_cap = max_sentences if conn else 0
+    # Splitting and extraction are pure per document, so they can run in worker
+    # processes; everything that writes stays in this loop, in input order.
+    extract_args = (
+        mention_extractor if should_process_sentences else None,
+        indication_extractor if conn else None,
+        sentence_cap,
+    )
+    workers = getattr(args, "workers", 1) or 1
+    pool = None
+    if split_in_workers and workers > 1 and len(normalized_results) > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(normalized_results)),
+            initializer=_init_split_worker,
+            initargs=extract_args,
+        )
+        split_documents = pool.map(
+            _split_in_worker, normalized_results, chunksize=SPLIT_CHUNKSIZE
+        )
+    else:
+        split_documents = map(
+            partial(_split_and_extract, splitter, *extract_args), normalized_results
+        )
+    with structured_path.open("wb", buffering=WRITE_BUFFER_SIZE) as f, pool or nullcontext():
+        for record, (doc, extracted) in zip(normalized_results, split_documents):
             sentence_rows: list[tuple[str, object]] = []
-            mention_batches: list[tuple[str, list[tuple[str, str, str, int, int, str]]]] = []
-            indication_batches: list[tuple[str, list[tuple[str, str, int, int]]]] = []
+            mention_rows: list[tuple[str, str, str, str, int, int, str]] = []
+            indication_rows: list[tuple[str, str, str, int, int]] = []
             sentence_co_mentions: list[tuple[str, str, str, int]] = []
             doc_mentions: list[ProductMention] = []
             has_sentence_co_mentions = False
-            max_sentences = getattr(args, "max_sentences_per_doc", 0) or 0
-            max_pairs = getattr(args, "max_co_mentions_per_sentence", 0) or 0
             warned_sentence_cap = False
             warned_pair_cap = False
 
             if should_process_sentences:
                 for idx, sentence in enumerate(doc.iter_sentences()):
-                    sentence_cap = max_sentences if conn else 0
                     if sentence_cap and idx >= sentence_cap:
                         if not warned_sentence_cap and conn:
                             print(
@@ -497,7 +625,7 @@ def run_ingestion(
                     if conn:
                         sentence_rows.append((sentence_id, sentence))
 
-                    mentions = mention_extractor.extract(sentence.text) if mention_extractor else []
+                    mentions, indications = extracted[idx] if extracted else ([], [])
                     if mentions:
                         if conn:
                             doc_mentions.extend(mentions)
@@ -519,8 +647,9 @@ def run_ingestion(
                                 )
 
                         if conn:
-                            mention_rows = [
+                            mention_rows.extend(
                                 (
+                                    sentence_id,
                                     f"{sentence_id}:{m.product_canonical}:{m.start_char}-{m.end_char}",
                                     m.product_canonical,
                                     m.alias_matched,
@@ -529,29 +658,32 @@ def run_ingestion(
                                     m.match_method,
                                 )
                                 for m in mentions
-                            ]
-                            mention_batches.append((sentence_id, mention_rows))
+                            )
 
-                    if indication_extractor and conn:
-                        indications = indication_extractor.extract(sentence.text)
-                        if indications:
-                            indication_rows = [
-                                (
-                                    indication.indication_canonical,
-                                    indication.alias_matched,
-                                    indication.start_char,
-                                    indication.end_char,
-                                )
-                                for indication in indications
-                            ]
-                            indication_batches.append((sentence_id, indication_rows))
+                    if indications:
+                        indication_rows.extend(
+                            (
+                                sentence_id,
+                                indication.indication_canonical,
+                                indication.alias_matched,
+                                indication.start_char,
+                                indication.end_char,
+                            )
+                            for indication in indications
+                        )
 
             if require_comentions and not has_sentence_co_mentions:
                 skipped_comention_docs += 1
                 continue
 
-            documents.append(doc)
-            f.write(json.dumps(doc.to_dict()) + "\n")
+            f.write(_json_line(doc.to_dict()))
+            if first_document is None:
+                first_document = doc
+            if doc.publication_date:
+                doc_key = (doc.publication_date, doc.pmid or "")
+                if latest_key is None or doc_key > latest_key:
+                    latest_key = doc_key
+                    latest_pmid = doc.pmid
 
             if conn:
                 upsert_document(conn, doc, raw_json=record.raw)
@@ -565,13 +697,10 @@ def run_ingestion(
 
                 if sentence_rows:
                     insert_sentences(conn, doc.doc_id, sentence_rows)
-                for sentence_id, mention_rows in mention_batches:
-                    insert_mentions(conn, doc.doc_id, sentence_id, mention_rows)
-                if indication_extractor:
-                    for sentence_id, indication_rows in indication_batches:
-                        insert_sentence_indications(
-                            conn, doc.doc_id, sentence_id, indication_rows
-                        )
+                if mention_rows:
+                    insert_document_mentions(conn, doc.doc_id, mention_rows)
+                if indication_rows:
+                    insert_document_indications(conn, doc.doc_id, indication_rows)
                 if mention_extractor and sentence_co_mentions:
                     insert_co_mentions_sentences(conn, doc.doc_id, sentence_co_mentions)
                 if mention_extractor and doc_mentions:
@@ -590,26 +719,13 @@ def run_ingestion(
             f"Skipped {skipped_comention_docs} documents without sentence-level co-mentions "
             "due to --require-comentions."
         )
-    if documents:
-        section_counts = sentence_counts_by_section(documents[0])
-        mean_len = mean_sentence_length(documents[0])
+    if first_document is not None:
+        section_counts = sentence_counts_by_section(first_document)
+        mean_len = mean_sentence_length(first_document)
         print(f"Example sentence counts: {section_counts}")
         print(f"Mean sentence length (first doc): {mean_len:.1f} chars")
 
-    latest_pub_date = max(
-        (doc.publication_date for doc in documents if doc.publication_date),
-        default=None,
-    )
-    latest_pmid = None
-    if latest_pub_date:
-        for doc in sorted(
-            documents,
-            key=lambda d: (d.publication_date or date.min, d.pmid or ""),
-            reverse=True,
-        ):
-            if doc.publication_date == latest_pub_date:
-                latest_pmid = doc.pmid
-                break
+    latest_pub_date = latest_key[0] if latest_key else None
 
     if incremental and conn:
         if latest_pub_date:
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import json
-import sqlite3
+import sys
 from pathlib import Path
 from typing import Iterable, Optional
 import math
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from src.analytics import build_narrative_card, explain_confidence, fetch_sentence_evidence
 from src.analytics.weights import load_study_type_weights
+from src.storage import connect_readonly
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 DEFAULT_METRICS_DIR = Path("data/processed/metrics")
@@ -147,7 +152,7 @@ def _render_evidence(
             if not db_path.exists():
                 st.error(f"SQLite database not found at {db_path}")
                 return
-            conn = sqlite3.connect(db_path)
+            conn = connect_readonly(db_path)
             evidence = fetch_sentence_evidence(
                 conn,
                 product_a=product_a,
@@ -363,7 +368,7 @@ def _load_narrative_cards(
         return []
 
     metrics_lookup = _latest_metrics_lookup(narratives_frame)
-    conn = sqlite3.connect(db_path)
+    conn = connect_readonly(db_path)
     cards: list[dict] = []
     try:
         for entry in candidates:
@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import argparse
 import sqlite3
+import sys
 from collections import defaultdict
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from src.analytics.weights import STUDY_TYPE_ALIASES, load_study_type_weights
+from src.storage import connect_readonly
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 
@@ -49,7 +55,7 @@ def main() -> None:
     if not args.db.exists():
         raise SystemExit(f"SQLite database not found at {args.db}. Run ingestion with --db first.")
 
-    con = sqlite3.connect(args.db)
+    con = connect_readonly(args.db)
     con.row_factory = sqlite3.Row
     study_weight_lookup = load_study_type_weights(args.study_weight_config)
 
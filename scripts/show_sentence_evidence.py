@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import argparse
-import sqlite3
+import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from src.analytics import explain_confidence, fetch_sentence_evidence
 from src.analytics.weights import load_study_type_weights
+from src.storage import connect_readonly
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 
@@ -48,7 +53,7 @@ def main() -> None:
             f"SQLite database not found at {args.db}. Run ingestion and labeling scripts first."
         )
 
-    conn = sqlite3.connect(args.db)
+    conn = connect_readonly(args.db)
     study_weight_lookup = load_study_type_weights(args.study_weight_config)
 
     evidence_rows = fetch_sentence_evidence(
@@ -6,12 +6,17 @@ weights, and labels without needing to write SQL queries manually.
 
 from __future__ import annotations
 
-import sqlite3
+import sys
 from pathlib import Path
 from typing import Iterable, Optional
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from src.analytics import fetch_sentence_evidence
 from src.analytics.weights import STUDY_TYPE_ALIASES, load_study_type_weights
+from src.storage import connect_readonly
 
 DEFAULT_DB = Path("data/europepmc.sqlite")
 DEFAULT_WEIGHT_CONFIG = Path("config/study_type_weights.json")
@@ -34,7 +39,7 @@ def _load_evidence(
     narrative_type: Optional[str],
     narrative_subtype: Optional[str],
 ) -> Iterable[dict]:
-    conn = sqlite3.connect(db_path)
+    conn = connect_readonly(db_path)
     rows = fetch_sentence_evidence(
         conn,
         product_a=product_a,
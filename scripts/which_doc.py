@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import argparse
-import sqlite3
+import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.storage import connect_readonly
+
 DEFAULT_DB = Path("data/europepmc.sqlite")
 
 
@@ -39,7 +45,7 @@ def main() -> None:
     if not args.db.exists():
         raise SystemExit(f"SQLite database not found at {args.db}. Run ingestion with --db first.")
 
-    con = sqlite3.connect(args.db)
+    con = connect_readonly(args.db)
     cur = con.cursor()
 
     rows = cur.execute(
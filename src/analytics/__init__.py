@@ -10,6 +10,7 @@ from .evidence import (
     SentenceEvidence,
     explain_confidence,
     fetch_sentence_evidence,
+    iter_sentence_evidence,
     build_narrative_card,
     NarrativeEvidenceCard,
     resolve_study_weight,
@@ -35,7 +36,9 @@ from .time_series import (
     add_change_metrics,
     add_sentiment_ratios,
     bucket_counts,
+    bucketed_rows,
     sentiment_bucket_counts,
+    sql_bucket_start,
 )
 from .weights import (
     DocumentWeight,
@@ -82,13 +85,16 @@ __all__ = [
     "map_study_type",
     "sentence_counts_by_section",
     "fetch_sentence_evidence",
+    "iter_sentence_evidence",
     "build_narrative_card",
     "serialize_sentence_evidence",
     "TimeSeriesConfig",
     "add_change_metrics",
     "bucket_counts",
+    "bucketed_rows",
     "add_sentiment_ratios",
     "sentiment_bucket_counts",
+    "sql_bucket_start",
     "SentimentLabel",
     "SentimentResult",
     "classify_batch",
@@ -4,7 +4,7 @@ import json
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Mapping, Optional, Sequence
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
 
 from src.analytics.sections import normalize_section
 from src.analytics.weights import STUDY_TYPE_ALIASES
@@ -121,7 +121,7 @@ class SentenceEvidence:
         return payload
 
 
-def fetch_sentence_evidence(
+def iter_sentence_evidence(
     conn: sqlite3.Connection,
     *,
     product_a: Optional[str] = None,
@@ -132,7 +132,12 @@ def fetch_sentence_evidence(
     direction_type: Optional[str] = None,
     direction_role: Optional[str] = None,
     limit: int = 200,
-) -> List[SentenceEvidence]:
+) -> Iterator[SentenceEvidence]:
+    """Yield evidence rows as the query cursor produces them.
+
+    :func:`fetch_sentence_evidence` is the list-returning wrapper.
+    """
+
     columns = {
         row[1] for row in conn.execute("PRAGMA table_info(sentence_events)").fetchall()
     }
@@ -273,9 +278,8 @@ def fetch_sentence_evidence(
     params.append(limit)
 
     cur = conn.execute("\n".join(query), params)
-    rows: List[SentenceEvidence] = []
     last_section_by_doc: Dict[str, str] = {}
-    for row in cur.fetchall():
+    for row in cur:
         (
             doc_id,
             sentence_id,
@@ -373,43 +377,68 @@ def fetch_sentence_evidence(
             canonical_section = last_section_by_doc[doc_id]
         section_value = canonical_section or section
 
-        rows.append(
-            SentenceEvidence(
-                doc_id=doc_id,
-                sentence_id=sentence_id,
-                product_a=product_a,
-                product_a_alias=product_a_alias,
-                product_b=product_b,
-                product_b_alias=product_b_alias,
-                count=int(count or 0),
-                sentence_text=sentence_text,
-                section=section_value,
-                sent_index=sent_index,
-                publication_date=publication_date,
-                journal=journal,
-                recency_weight=recency_weight,
-                study_type=study_type,
-                study_type_weight=study_type_weight,
-                combined_weight=combined_weight,
-                labels=labels,
-                matched_terms=matched_terms,
-                context_rule_hits=context_rules,
-                indications=indications,
-                direction_type=direction_type_val,
-                product_a_role=product_a_role_val,
-                product_b_role=product_b_role_val,
-                direction_triggers=direction_triggers,
-                narrative_type=narrative_type_val,
-                narrative_subtype=narrative_subtype_val,
-                narrative_confidence=narrative_confidence_val,
-                sentiment_label=sentiment_label_val,
-                sentiment_score=sentiment_score_val,
-                sentiment_model=sentiment_model_val,
-                sentiment_inference_ts=sentiment_ts_val,
-            )
+        yield SentenceEvidence(
+            doc_id=doc_id,
+            sentence_id=sentence_id,
+            product_a=product_a,
+            product_a_alias=product_a_alias,
+            product_b=product_b,
+            product_b_alias=product_b_alias,
+            count=int(count or 0),
+            sentence_text=sentence_text,
+            section=section_value,
+            sent_index=sent_index,
+            publication_date=publication_date,
+            journal=journal,
+            recency_weight=recency_weight,
+            study_type=study_type,
+            study_type_weight=study_type_weight,
+            combined_weight=combined_weight,
+            labels=labels,
+            matched_terms=matched_terms,
+            context_rule_hits=context_rules,
+            indications=indications,
+            direction_type=direction_type_val,
+            product_a_role=product_a_role_val,
+            product_b_role=product_b_role_val,
+            direction_triggers=direction_triggers,
+            narrative_type=narrative_type_val,
+            narrative_subtype=narrative_subtype_val,
+            narrative_confidence=narrative_confidence_val,
+            sentiment_label=sentiment_label_val,
+            sentiment_score=sentiment_score_val,
+            sentiment_model=sentiment_model_val,
+            sentiment_inference_ts=sentiment_ts_val,
         )
 
-    return rows
+
+def fetch_sentence_evidence(
+    conn: sqlite3.Connection,
+    *,
+    product_a: Optional[str] = None,
+    product_b: Optional[str] = None,
+    pub_after: Optional[str] = None,
+    narrative_type: Optional[str] = None,
+    narrative_subtype: Optional[str] = None,
+    direction_type: Optional[str] = None,
+    direction_role: Optional[str] = None,
+    limit: int = 200,
+) -> List[SentenceEvidence]:
+    """Return :func:`iter_sentence_evidence` results as a list."""
+
+    return list(
+        iter_sentence_evidence(
+            conn,
+            product_a=product_a,
+            product_b=product_b,
+            pub_after=pub_after,
+            narrative_type=narrative_type,
+            narrative_subtype=narrative_subtype,
+            direction_type=direction_type,
+            direction_role=direction_role,
+            limit=limit,
+        )
+    )
 
 
 def serialize_sentence_evidence(
@@ -68,9 +68,11 @@ class MentionExtractor:
     ):
         self.use_model_assisted = use_model_assisted
         self.patterns: List[tuple[str, str, re.Pattern[str]]] = []
+        escaped_aliases: List[str] = []
         for canonical, aliases in product_aliases.items():
             for alias in aliases:
                 escaped = re.escape(alias)
+                escaped_aliases.append(escaped)
                 plural_suffix = r"(?:['’]s|s|es)?"
                 boundary_prefix = r"(?:\b|(?<=['’]))"
                 boundary_suffix = r"(?:\b|(?=['’]))"
@@ -79,6 +81,11 @@ class MentionExtractor:
                     flags=re.IGNORECASE,
                 )
                 self.patterns.append((canonical, alias, pattern))
+        # Every per-alias pattern needs its alias somewhere in the text, so one
+        # scan for any alias rules out most sentences before the per-alias loop.
+        self._any_alias = (
+            re.compile("|".join(escaped_aliases), flags=re.IGNORECASE) if escaped_aliases else None
+        )
 
         self.nlp = None
         if use_model_assisted:
@@ -106,6 +113,8 @@ class MentionExtractor:
 
     def _extract_with_regex(self, text: str) -> List[ProductMention]:
         mentions: List[ProductMention] = []
+        if self._any_alias is None or not self._any_alias.search(text):
+            return mentions
         for canonical, alias, pattern in self.patterns:
             for match in pattern.finditer(text):
                 mentions.append(
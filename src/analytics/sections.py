@@ -9,6 +9,12 @@ from typing import Dict, Iterable, Tuple
 
 DEFAULT_SECTION_CONFIG = Path("config/section_aliases.json")
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_ALIAS_PART_SPLIT_RE = re.compile(r"[\\/&|]+")
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+_HEADING_TAG_RE = re.compile(r"<h\d[^>]*>([^<]{1,80})</h\d>", flags=re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class SectionAliasSpec:
@@ -26,8 +32,8 @@ def _resolve_config_path(path: Path | str | None) -> Path:
 def _normalize_token(value: str) -> str:
     cleaned = value.strip().casefold()
     cleaned = cleaned.replace("_", " ")
-    cleaned = re.sub(r"[^\w\s]", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = _NON_WORD_RE.sub(" ", cleaned)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned)
     return cleaned.strip()
 
 
@@ -54,40 +60,45 @@ def load_section_aliases(path: Path | str | None = None) -> Dict[str, Tuple[str,
     return _load_aliases_cached(str(resolved))
 
 
-def _match_alias(token: str | None, aliases: Dict[str, Tuple[str, ...]]) -> str | None:
-    if not token:
-        return None
+@lru_cache(maxsize=4)
+def _alias_index_cached(resolved_path: str) -> Tuple[Dict[str, str], int]:
+    """Map each normalized alias to its canonical section, plus the longest alias length.
 
-    def _lookup(normalized: str) -> str | None:
-        if not normalized:
-            return None
-        for canonical, candidates in aliases.items():
-            if normalized == canonical or normalized in candidates:
-                return canonical
+    The first canonical listing an alias wins, matching the config's iteration order.
+    """
+
+    index: Dict[str, str] = {}
+    for canonical, candidates in _load_aliases_cached(resolved_path).items():
+        index.setdefault(canonical, canonical)
+        for candidate in candidates:
+            index.setdefault(candidate, canonical)
+    return index, max((len(token) for token in index), default=0)
+
+
+def _match_alias(token: str | None, index: Dict[str, str]) -> str | None:
+    if not token:
         return None
 
-    normalized = _normalize_token(token)
-    canonical = _lookup(normalized)
+    canonical = index.get(_normalize_token(token))
     if canonical:
         return canonical
 
-    parts = re.split(r"[\\/&|]+", token)
+    parts = _ALIAS_PART_SPLIT_RE.split(token)
     for part in parts:
         if not part or part == token:
             continue
-        part_normalized = _normalize_token(part)
-        canonical = _lookup(part_normalized)
+        canonical = index.get(_normalize_token(part))
         if canonical:
             return canonical
     return None
 
 
 def _match_leading_heading(
-    text: str, aliases: Dict[str, Tuple[str, ...]]
+    text: str, index: Dict[str, str], max_alias_length: int
 ) -> tuple[int, int, str] | None:
     if not text:
         return None
-    leading_whitespace = re.match(r"\s*", text)
+    leading_whitespace = _LEADING_WHITESPACE_RE.match(text)
     offset = leading_whitespace.end() if leading_whitespace else 0
     stripped = text[offset:]
     if not stripped:
@@ -98,11 +109,10 @@ def _match_leading_heading(
         normalized = _normalize_token(segment)
         if not normalized:
             continue
-        canonical = None
-        for key, candidates in aliases.items():
-            if normalized == key or normalized in candidates:
-                canonical = key
-                break
+        # Normalized prefixes only grow, so none past the longest alias can match.
+        if len(normalized) > max_alias_length:
+            break
+        canonical = index.get(normalized)
         if canonical:
             next_char = stripped[length:length + 1]
             if not next_char or not next_char.isalpha() or next_char.isupper():
@@ -124,7 +134,7 @@ def normalize_section(
     determines the section.
     """
 
-    aliases = load_section_aliases(config_path)
+    index, max_alias_length = _alias_index_cached(str(_resolve_config_path(config_path)))
     candidates: list[str] = []
 
     if raw_section:
@@ -142,7 +152,7 @@ def normalize_section(
             candidates.insert(0, prefix)
             cleaned_text = remainder.lstrip(" -–—")
 
-        tag_match = re.search(r"<h\d[^>]*>([^<]{1,80})</h\d>", text, flags=re.IGNORECASE)
+        tag_match = _HEADING_TAG_RE.search(text)
         if tag_match:
             heading_prefix = tag_match.group(1)
             candidates.insert(0, heading_prefix)
@@ -152,7 +162,7 @@ def normalize_section(
                 cleaned_text = text[:tag_match.start()].strip()
 
         if heading_prefix is None:
-            heading_match = _match_leading_heading(text, aliases)
+            heading_match = _match_leading_heading(text, index, max_alias_length)
             if heading_match:
                 _, end_idx, fragment = heading_match
                 heading_prefix = fragment
@@ -160,7 +170,7 @@ def normalize_section(
                 cleaned_text = text[end_idx:].lstrip(" -–—")
 
     for candidate in candidates:
-        canonical = _match_alias(candidate, aliases)
+        canonical = _match_alias(candidate, index)
         if canonical:
             if heading_prefix and candidate == heading_prefix:
                 return canonical, cleaned_text, True
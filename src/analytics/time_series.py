@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from math import sqrt
@@ -38,6 +39,42 @@ def _bucket_start(ts: datetime, freq: str) -> datetime:
     return monday.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
+def sql_bucket_start(column: str, freq: str) -> str:
+    """Return a SQLite expression mapping ``column`` to its bucket start date.
+
+    Mirrors :func:`_bucket_start` so callers can push bucketing into ``GROUP BY``.
+    """
+
+    if freq == "M":
+        return f"date({column}, 'start of month')"
+
+    if freq != "W":
+        raise ValueError(f"Unsupported freq '{freq}'. Use 'W' or 'M'.")
+
+    return f"date({column}, '-6 days', 'weekday 1')"
+
+
+def bucketed_rows(
+    rows: Iterable[Dict[str, object]], value_columns: Sequence[str] = ("count",)
+) -> List[Dict[str, object]]:
+    """Normalize rows already bucketed in SQL to the shape of :func:`bucket_counts`."""
+
+    results: List[Dict[str, object]] = []
+    parsed: Dict[object, datetime] = {}
+    for row in rows:
+        bucket = row.get("bucket_start")
+        if bucket is None:
+            continue
+        if bucket not in parsed:
+            parsed[bucket] = _parse_timestamp(bucket)
+        entry = dict(row)
+        entry["bucket_start"] = parsed[bucket]
+        for column in value_columns:
+            entry[column] = float(entry.get(column) or 0.0)
+        results.append(entry)
+    return results
+
+
 def bucket_counts(config: TimeSeriesConfig, rows: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
     """Aggregate rows into time buckets."""
 
@@ -68,12 +105,14 @@ def bucket_counts(config: TimeSeriesConfig, rows: Iterable[Dict[str, object]]) -
     return results
 
 
-def _rolling_stats(values: List[float], window: int) -> tuple[Optional[float], Optional[float]]:
+def _rolling_stats(values: Sequence[float], window: int) -> tuple[Optional[float], Optional[float]]:
+    """Mean and population std of ``values``, which holds at most the last ``window`` points."""
+
     if len(values) < window:
         return None, None
 
-    mean = sum(values[-window:]) / window
-    variance = sum((v - mean) ** 2 for v in values[-window:]) / window
+    mean = sum(values) / window
+    variance = sum((v - mean) ** 2 for v in values) / window
     std = sqrt(variance)
     return mean, std
 
@@ -97,7 +136,7 @@ def add_change_metrics(
 
     for key, rows in groups.items():
         rows.sort(key=lambda r: r["bucket_start"])
-        history: List[float] = []
+        history: deque[float] = deque(maxlen=window)
         prev: Optional[float] = None
 
         for row in rows:
@@ -1,8 +1,12 @@
 from .sqlite_store import (
+    apply_read_pragmas,
+    connect_readonly,
     get_ingest_status,
     init_db,
     insert_co_mentions,
     insert_co_mentions_sentences,
+    insert_document_indications,
+    insert_document_mentions,
     insert_mentions,
     insert_sentence_events,
     insert_sentence_indications,
@@ -14,10 +18,14 @@ from .sqlite_store import (
 )
 
 __all__ = [
+    "apply_read_pragmas",
+    "connect_readonly",
     "get_ingest_status",
     "init_db",
     "insert_co_mentions",
     "insert_co_mentions_sentences",
+    "insert_document_indications",
+    "insert_document_mentions",
     "insert_mentions",
     "insert_sentence_events",
     "insert_sentence_indications",
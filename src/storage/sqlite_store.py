@@ -6,6 +6,11 @@ from datetime import date
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
+try:  # Optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    orjson = None  # type: ignore
+
 from src.analytics.weights import DocumentWeight
 # Avoid importing structuring models (which depends on pydantic) at import time.
 # These classes are only needed for typing, so lazy-import them via TYPE_CHECKING.
@@ -151,12 +156,18 @@ CREATE_TABLES_SQL = [
     CREATE INDEX IF NOT EXISTS idx_documents_pmid ON documents(pmid)
     """,
     """
+    CREATE INDEX IF NOT EXISTS idx_documents_doc_date ON documents(doc_id, publication_date)
+    """,
+    """
     CREATE INDEX IF NOT EXISTS idx_sentences_doc ON sentences(doc_id)
     """,
     """
     CREATE INDEX IF NOT EXISTS idx_mentions_product ON product_mentions(product_canonical)
     """,
     """
+    CREATE INDEX IF NOT EXISTS idx_mentions_product_doc ON product_mentions(product_canonical, doc_id)
+    """,
+    """
     CREATE INDEX IF NOT EXISTS idx_mentions_doc ON product_mentions(doc_id)
     """,
     """
@@ -235,6 +246,28 @@ CREATE_VIEWS_SQL = [
 ]
 
 
+READ_PRAGMAS = [
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA mmap_size = 268435456;",
+    "PRAGMA cache_size = -131072;",
+]
+
+
+def apply_read_pragmas(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Tune a connection for the large scans run by aggregation and export scripts."""
+
+    for stmt in READ_PRAGMAS:
+        conn.execute(stmt)
+    return conn
+
+
+def connect_readonly(path: Path | str) -> sqlite3.Connection:
+    """Open an existing database read-only, tuned with :data:`READ_PRAGMAS`."""
+
+    uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+    return apply_read_pragmas(sqlite3.connect(uri, uri=True))
+
+
 def init_db(path: Path | str) -> sqlite3.Connection:
     db_path = Path(path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -421,6 +454,12 @@ def _ensure_ingest_status_schema(conn: sqlite3.Connection) -> None:
     )
 
 
+def _dump_raw_json(raw_json: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(raw_json).decode("utf-8")
+    return json.dumps(raw_json)
+
+
 def upsert_document(conn: sqlite3.Connection, document: Document, raw_json: Optional[dict] = None) -> None:
     conn.execute(
         """
@@ -442,7 +481,7 @@ def upsert_document(conn: sqlite3.Connection, document: Document, raw_json: Opti
             document.study_design,
             document.study_phase,
             document.sample_size,
-            json.dumps(raw_json) if raw_json is not None else None,
+            _dump_raw_json(raw_json) if raw_json is not None else None,
         ),
     )
 
@@ -520,6 +559,30 @@ def insert_mentions(
     )
 
 
+def insert_document_mentions(
+    conn: sqlite3.Connection,
+    doc_id: str,
+    mention_rows: Iterable[Tuple[str, str, str, str, int, int, str]],
+) -> None:
+    """
+    Insert every mention of a document in one ``executemany``.
+
+    Each row should be a tuple of ``(sentence_id, mention_id, product_canonical,
+    alias_matched, start_char, end_char, match_method)``.
+    """
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO product_mentions (
+            mention_id, doc_id, sentence_id, product_canonical, alias_matched, start_char, end_char, match_method
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (mention_id, doc_id, sentence_id, canonical, alias, start, end, match_method)
+            for sentence_id, mention_id, canonical, alias, start, end, match_method in mention_rows
+        ),
+    )
+
+
 def insert_sentence_indications(
     conn: sqlite3.Connection,
     doc_id: str,
@@ -546,6 +609,30 @@ def insert_sentence_indications(
     )
 
 
+def insert_document_indications(
+    conn: sqlite3.Connection,
+    doc_id: str,
+    indication_rows: Iterable[Tuple[str, str, str, int, int]],
+) -> None:
+    """
+    Insert every indication of a document in one ``executemany``.
+
+    Each row should be a tuple of ``(sentence_id, indication_canonical,
+    alias_matched, start_char, end_char)``.
+    """
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO sentence_indications (
+            doc_id, sentence_id, indication_canonical, alias_matched, start_char, end_char
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (doc_id, sentence_id, canonical, alias, start, end)
+            for sentence_id, canonical, alias, start, end in indication_rows
+        ),
+    )
+
+
 def insert_co_mentions(
     conn: sqlite3.Connection, doc_id: str, co_mentions: Iterable[Tuple[str, str, int]]
 ) -> None:
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+try:  # Optional dependency
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - handled in code paths
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+PARQUET_ROW_GROUP_SIZE = 65_536
+
+
+def write_rows(outdir: Path, name: str, frames: Dict[str, List[dict]]) -> None:
+    """Write aggregated rows to ``<outdir>/<name>_<freq>.parquet``, one file per frequency.
+
+    Writes zstd-compressed, dictionary-encoded parquet straight from the row
+    dicts with pyarrow in bounded row groups, then tries pandas; otherwise falls
+    back to JSON with a parquet extension so downstream tooling can still locate
+    the export.
+    """
+
+    pd = None
+    if pa is None:
+        try:
+            import pandas as pd  # type: ignore
+        except ImportError:
+            pd = None  # type: ignore
+
+    outdir.mkdir(parents=True, exist_ok=True)
+    for freq, rows in frames.items():
+        outfile = outdir / f"{name}_{freq.lower()}.parquet"
+        if pa is not None:
+            pq.write_table(
+                pa.Table.from_pylist(rows),
+                outfile,
+                compression="zstd",
+                use_dictionary=True,
+                row_group_size=PARQUET_ROW_GROUP_SIZE,
+            )
+        elif pd is not None:
+            df = pd.DataFrame(rows)
+            df.to_parquet(outfile, index=False)
+        else:
+            with outfile.open("w", encoding="utf-8") as f:
+                json.dump(rows, f, default=str)
+        print(f"Wrote {outfile} ({len(rows)} rows)")
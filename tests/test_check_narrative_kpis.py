@@ -108,10 +108,33 @@ def test_confidence_validator_flags_small_gap(tmp_path: Path) -> None:
         ],
     )
     con.commit()
-    con.close()
 
     with pytest.raises(SystemExit):
-        validator._ensure_confidence_metrics(db_path, spec)
+        validator._ensure_confidence_metrics(con, spec)
+    con.close()
+
+
+def test_confidence_validator_normalizes_types_like_python(tmp_path: Path) -> None:
+    spec = make_spec()
+    con = sqlite3.connect(tmp_path / "norm.sqlite")
+    con.execute("CREATE TABLE sentence_events (narrative_type TEXT, narrative_subtype TEXT, narrative_confidence REAL)")
+    con.executemany(
+        "INSERT INTO sentence_events VALUES (?, ?, ?)",
+        [
+            ("Safety\t", "safety_signal", 0.9),
+            ("safety", "safety_signal", 0.85),
+            ("ÉVIDENCE", "real_world", 0.9),
+            ("évidence\n", "real_world", 0.8),
+        ],
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        validator._ensure_confidence_metrics(con, spec)
+    con.close()
+
+    message = str(excinfo.value)
+    assert "safety confidence gap 0.05" in message
+    assert "évidence confidence gap 0.10" in message
 
 
 def test_competitive_accuracy_validator_passes(tmp_path: Path) -> None:
@@ -131,6 +154,29 @@ def test_competitive_accuracy_validator_passes(tmp_path: Path) -> None:
     validator._ensure_competitive_accuracy(metrics_dir, tmp_path, spec)
 
 
+def test_competitive_accuracy_validates_entries_after_early_failure(tmp_path: Path) -> None:
+    spec = make_spec(reference_file="ref.json", competitive_sample_size=1, min_accuracy=1.0)
+    reference_path = tmp_path / "ref.json"
+    reference_path.write_text(
+        json.dumps(
+            [
+                {"product_pair": "drug_alpha vs drug_beta", "expected_role": "favored"},
+                {"product_pair": "drug_alpha drug_gamma", "expected_role": "favored"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "directional_w.parquet").write_text(
+        json.dumps([{"product": "drug_alpha", "partner": "drug_beta", "role": "disfavored"}]),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(SystemExit, match="Invalid product_pair"):
+        validator._ensure_competitive_accuracy(metrics_dir, tmp_path, spec)
+
+
 def test_narrative_invariants_enforce_ratio(tmp_path: Path) -> None:
     spec = make_spec()
     db_path = tmp_path / "inv.sqlite"
@@ -147,10 +193,10 @@ def test_narrative_invariants_enforce_ratio(tmp_path: Path) -> None:
         ],
     )
     con.commit()
-    con.close()
 
     with pytest.raises(SystemExit):
-        validator._ensure_narrative_invariants(db_path, spec)
+        validator._ensure_narrative_invariants(con, spec)
+    con.close()
 
 
 def test_narrative_invariants_missing_flags(tmp_path: Path) -> None:
@@ -168,7 +214,7 @@ def test_narrative_invariants_missing_flags(tmp_path: Path) -> None:
         ],
     )
     con.commit()
-    con.close()
 
     with pytest.raises(SystemExit):
-        validator._ensure_narrative_invariants(db_path, spec)
+        validator._ensure_narrative_invariants(con, spec)
+    con.close()
@@ -193,6 +193,36 @@ def test_aggregate_metrics_cli_emits_narrative_change(tmp_path, monkeypatch) ->
         assert directional_file.read_text(encoding="utf-8").strip()
 
 
+def test_aggregate_metrics_defaults_weights_and_labels_in_sql(tmp_path) -> None:
+    con = init_db(tmp_path / "weights.sqlite")
+    for doc_id, day in (("doc-1", "2024-03-04"), ("doc-2", "2024-03-20")):
+        con.execute(
+            "INSERT INTO documents (doc_id, title, publication_date, pub_year, raw_json) VALUES (?, ?, ?, ?, ?)",
+            (doc_id, doc_id, day, 2024, "{}"),
+        )
+        con.execute(
+            "INSERT INTO sentences (sentence_id, doc_id, section, sent_index, text) VALUES (?, ?, ?, ?, ?)",
+            (f"{doc_id}-s", doc_id, "results", 0, "ProductA beat ProductB."),
+        )
+        con.execute(
+            "INSERT INTO sentence_events (doc_id, sentence_id, product_a, product_b, narrative_type, narrative_subtype, claim_strength) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (doc_id, f"{doc_id}-s", "ProductA", "ProductB", "comparative", "efficacy", ""),
+        )
+    con.execute(
+        "INSERT INTO document_weights (doc_id, recency_weight, study_type, study_type_weight, combined_weight) VALUES (?, ?, ?, ?, ?)",
+        ("doc-1", 0.9, "randomized controlled trial", 1.4, 1.8),
+    )
+    con.commit()
+
+    weighted = aggregate_metrics._aggregate_weighted_narratives(con, ["M"])["M"]
+    assert [row["weighted_count"] for row in weighted] == [2.8]
+
+    dimensions = aggregate_metrics._aggregate_narrative_dimensions(con, ["M"])["M"]
+    assert {(row["claim_strength"], row["risk_posture"]) for row in dimensions} == {
+        ("unlabeled", "unlabeled")
+    }
+
+
 def _seed_labeling_db(db_path: Path) -> None:
     con = init_db(db_path)
     con.execute(
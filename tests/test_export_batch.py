@@ -1,9 +1,13 @@
 import json
 import os
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
-from scripts.export_batch import run_export
+import pytest
+
+from scripts.export_batch import _export_table, run_export
+from src.analytics import SentenceEvidence
 from src.storage import init_db
 
 
@@ -157,3 +161,75 @@ def test_export_creates_outputs_and_prunes_old_runs(tmp_path: Path) -> None:
 
     assert not old_run.exists()
     assert not old_file.exists()
+
+
+def test_evidence_parquet_follows_serialized_rows(tmp_path: Path, monkeypatch) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    from scripts import export_batch
+
+    monkeypatch.setattr(export_batch, "PARQUET_ROW_GROUP_SIZE", 1)
+    base = dict(
+        doc_id="doc-1",
+        sentence_id="sent-1",
+        product_a="ProductA",
+        product_a_alias=None,
+        product_b="ProductB",
+        product_b_alias=None,
+        sentence_text="Sentence one.",
+        publication_date="2024-01-10",
+        journal=None,
+        section="abstract",
+        sent_index=0,
+        count=1,
+        recency_weight=None,
+        study_type=None,
+        study_type_weight=None,
+        combined_weight=None,
+        labels=[],
+        matched_terms=None,
+    )
+    first = SentenceEvidence(**base).to_dict(include_confidence=True)
+    second = SentenceEvidence(
+        **{**base, "journal": "Lancet", "recency_weight": 0.8, "labels": ["superiority"]},
+        sentiment_score=0.4,
+    ).to_dict(include_confidence=True)
+    rows = [{**row, "added_later": None} for row in (first, second)]
+
+    parquet_path = tmp_path / "evidence.parquet"
+    total = export_batch._write_evidence_files(
+        rows, tmp_path / "evidence.csv", tmp_path / "evidence.jsonl", parquet_path
+    )
+
+    exported = pq.read_table(parquet_path)
+    assert total == 2
+    assert exported.column_names == list(rows[0])
+    assert exported.column("journal").to_pylist() == [None, "Lancet"]
+    assert exported.column("labels").to_pylist() == [[], ["superiority"]]
+    assert exported.column("sentiment_score").to_pylist() == [None, 0.4]
+    breakdowns = exported.column("confidence_breakdown").to_pylist()
+    assert [item["recency_weight"] for item in breakdowns] == [None, 0.8]
+
+
+def test_raw_export_survives_affinity_violations(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    db_path = tmp_path / "loose.sqlite"
+    con = sqlite3.connect(db_path)
+    con.execute("CREATE TABLE loose (doc_id TEXT, pub_year INTEGER, score REAL)")
+    con.executemany(
+        "INSERT INTO loose VALUES (?, ?, ?)",
+        [("doc-1", 2024, 0.5), ("doc-2", "unknown", 1.5), ("doc-3", 2.5, None)],
+    )
+    con.commit()
+    con.close()
+
+    outdir = tmp_path / "raw"
+    table, result = _export_table((db_path, "loose", outdir))
+
+    assert table == "loose"
+    assert result["rows"] == 3
+    exported = pq.read_table(outdir / "loose.parquet").to_pydict()
+    assert exported["pub_year"] == ["2024", "unknown", "2.5"]
+    assert exported["score"] == ["0.5", "1.5", None]
+    lines = (outdir / "loose.csv").read_text(encoding="utf-8").splitlines()
+    assert lines == ["doc_id,pub_year,score", "doc-1,2024,0.5", "doc-2,unknown,1.5", "doc-3,2.5,"]
@@ -251,3 +251,68 @@ def test_require_comentions_skips_single_product_docs(tmp_path, monkeypatch, cap
 
     output = capsys.readouterr().out
     assert "Skipped" in output
+
+
+def test_split_workers_match_inline_processing(tmp_path, monkeypatch):
+    fake_results = [
+        EuropePMCSearchResult(
+            title=f"Entresto vs enalapril study {idx}.",
+            abstract="Background: Heart failure. Results: Entresto reduced mortality versus enalapril.",
+            raw={"id": idx},
+        )
+        for idx in range(4)
+    ]
+
+    class FakeClient:
+        def __init__(self, polite_delay_s: float = 0.0):
+            self.polite_delay_s = polite_delay_s
+
+        @staticmethod
+        def build_drug_query(**kwargs):
+            return "mock query"
+
+        @staticmethod
+        def fetch_search_page(query, cursor_mark: str = "*", **_: object):
+            payload = {"hitCount": len(fake_results), "resultList": {"result": [r.raw for r in fake_results]}}
+            return payload, True
+
+        def search(self, query, max_records=None, initial_payload=None, use_cursor=True):
+            return iter(fake_results)
+
+    monkeypatch.setattr(runner, "EuropePMCClient", FakeClient)
+
+    outputs = []
+    for workers in (1, 2):
+        processed_dir = tmp_path / f"processed_{workers}"
+        args = argparse.Namespace(
+            from_date=None,
+            to_date=None,
+            include_reviews=True,
+            include_trials=True,
+            output_prefix="split",
+            max_records=5,
+            page_size=5,
+            polite_delay=0.0,
+            legacy_pagination=False,
+            no_proxy=False,
+            proxy=None,
+            db=tmp_path / f"store_{workers}.sqlite",
+            product_config=pathlib.Path(__file__).resolve().parents[1] / "config" / "products.json",
+            expand_query_aliases=False,
+            require_all_products=False,
+            require_comentions=False,
+            workers=workers,
+        )
+        runner.run_ingestion(
+            ["enalapril"], args, raw_dir=tmp_path / "raw", processed_dir=processed_dir
+        )
+        conn = sqlite3.connect(tmp_path / f"store_{workers}.sqlite")
+        mentions = conn.execute(
+            "SELECT mention_id, product_canonical FROM product_mentions ORDER BY mention_id"
+        ).fetchall()
+        conn.close()
+        outputs.append(((processed_dir / "split_structured.jsonl").read_bytes(), mentions))
+
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0][0].splitlines()) == 4
+    assert outputs[0][1]
@@ -1,4 +1,5 @@
 import pathlib
+import sqlite3
 import sys
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -8,10 +9,15 @@ if str(ROOT) not in sys.path:
 from src.analytics.mention_extractor import MentionExtractor, co_mentions_from_sentence
 from datetime import date
 
+import pytest
+
 from src.storage import (
+    connect_readonly,
     get_ingest_status,
     init_db,
     insert_co_mentions,
+    insert_document_indications,
+    insert_document_mentions,
     insert_mentions,
     insert_sentences,
     update_ingest_status,
@@ -125,6 +131,60 @@ def test_sqlite_store_persists_documents_sentences_and_mentions(tmp_path):
     conn.close()
 
 
+def test_document_level_inserts_cover_every_sentence(tmp_path):
+    db_path = tmp_path / "pharma.sqlite"
+    conn = init_db(db_path)
+
+    doc_id = "med:pmid:2"
+    document = Document(
+        doc_id=doc_id,
+        source="MED",
+        pmid="2",
+        pmcid=None,
+        doi=None,
+        title=None,
+        abstract="Dupixent helped. Add insulin for diabetes.",
+        publication_date=None,
+        pub_year=None,
+        journal=None,
+    )
+    upsert_document(conn, document)
+    first = build_sentence_id(doc_id, "abstract", 0)
+    second = build_sentence_id(doc_id, "abstract", 1)
+    insert_sentences(
+        conn,
+        doc_id,
+        [
+            (first, Sentence(text="Dupixent helped.", index=0, start_char=0, end_char=16, section="abstract")),
+            (second, Sentence(text="Add insulin for diabetes.", index=1, start_char=17, end_char=42, section="abstract")),
+        ],
+    )
+    insert_document_mentions(
+        conn,
+        doc_id,
+        [
+            (first, f"{first}:dupilumab:0-8", "dupilumab", "Dupixent", 0, 8, "exact"),
+            (second, f"{second}:insulin:4-11", "insulin", "insulin", 4, 11, "exact"),
+        ],
+    )
+    insert_document_indications(
+        conn,
+        doc_id,
+        [(second, "diabetes", "diabetes", 20, 28)],
+    )
+    conn.commit()
+
+    assert conn.execute(
+        "SELECT sentence_id, product_canonical FROM product_mentions WHERE doc_id = ? ORDER BY sentence_id",
+        (doc_id,),
+    ).fetchall() == [(first, "dupilumab"), (second, "insulin")]
+    assert conn.execute(
+        "SELECT doc_id, sentence_id, indication_canonical FROM sentence_indications"
+    ).fetchall() == [(doc_id, second, "diabetes")]
+
+    conn.close()
+
+
 def test_ingest_status_round_trip(tmp_path):
     db_path = tmp_path / "pharma.sqlite"
     conn = init_db(db_path)
@@ -142,3 +202,14 @@ def test_ingest_status_round_trip(tmp_path):
 
     retrieved = get_ingest_status(conn, status_key)
     assert retrieved == (watermark, "12345")
+
+
+def test_connect_readonly_rejects_writes(tmp_path):
+    db_path = tmp_path / "pharma db.sqlite"
+    init_db(db_path).close()
+
+    conn = connect_readonly(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM documents").fetchone() == (0,)
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM documents")
+    conn.close()
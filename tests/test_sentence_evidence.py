@@ -2,7 +2,11 @@ import sqlite3
 import sqlite3
 from pathlib import Path
 
-from src.analytics.evidence import fetch_sentence_evidence, serialize_sentence_evidence
+from src.analytics.evidence import (
+    fetch_sentence_evidence,
+    iter_sentence_evidence,
+    serialize_sentence_evidence,
+)
 from src.storage import init_db
 
 
@@ -147,6 +151,10 @@ def test_fetch_sentence_evidence_orders_and_filters(tmp_path: Path) -> None:
     assert len(directional_filtered) == 1
     assert directional_filtered[0].product_a_role == "favored"
 
+    streamed = iter_sentence_evidence(con, product_a="ProductA", product_b="ProductB", limit=10)
+    assert next(streamed) == rows[0]
+    assert list(streamed) == rows[1:]
+
 
 def test_serialize_sentence_evidence_includes_computed_fields(tmp_path: Path) -> None:
     db_path = tmp_path / "evidence.sqlite"
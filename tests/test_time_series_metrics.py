@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from src.analytics.time_series import (
     TimeSeriesConfig,
     add_change_metrics,
     bucket_counts,
+    bucketed_rows,
     compute_change_status,
     sentiment_bucket_counts,
+    sql_bucket_start,
 )
 
 
@@ -147,3 +152,26 @@ def test_compute_change_status_flags_new_and_disappearing():
     assert safety["status"] == "new"
     assert positioning["status"] == "disappearing"
     assert positioning["delta_count"] == -5.0
+
+
+@pytest.mark.parametrize("freq", ["W", "M"])
+def test_sql_bucket_start_matches_python_buckets(freq):
+    dates = ["2024-01-01", "2024-01-07", "2024-02-29", "2024-03-10", "2023-12-31"]
+    rows = [{"publication_date": value} for value in dates]
+    config = TimeSeriesConfig(timestamp_column="publication_date", freq=freq)
+    expected = bucket_counts(config, rows)
+
+    con = sqlite3.connect(":memory:")
+    con.row_factory = sqlite3.Row
+    con.execute("CREATE TABLE documents (publication_date TEXT)")
+    con.executemany("INSERT INTO documents VALUES (?)", [(value,) for value in dates])
+    cur = con.execute(
+        f"""
+        SELECT {sql_bucket_start("publication_date", freq)} AS bucket_start, COUNT(*) AS count
+        FROM documents
+        GROUP BY bucket_start
+        ORDER BY bucket_start
+        """
+    )
+
+    assert bucketed_rows(dict(row) for row in cur) == expected